@@ -1,19 +1,56 @@
 import os
 import six
-import copy
+import math
 import logging
 import numpy as np
-from dataclasses import dataclass, field, is_dataclass
+from dataclasses import dataclass, field, fields
 from typing import Dict, List, Optional, Union
-from functools import partial
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
 
 import trimesh
-import trimesh.transformations as tra
 
 from lxml import etree
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 _logger = logging.getLogger(__name__)
 
+_EYE4 = np.eye(4)
+_EYE4.setflags(write=False)
+
+_DEFAULT_AXIS = np.array([1.0, 0.0, 0.0])
+_DEFAULT_AXIS.setflags(write=False)
+
+# mesh files are only loaded in parallel if a scene references more than this many
+_MIN_PREFETCH_FILES = 4
+
+
+def _add_slots(cls):
+    """Recreate a dataclass with __slots__ instead of a per-instance __dict__.
+    Same as dataclass(slots=True), which is only available in Python 3.10+.
+
+    Args:
+        cls (type): A dataclass.
+
+    Returns:
+        type: The dataclass with __slots__.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # default values are class attributes, they would conflict with the slots
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
 
 def _array_eq(arr1, arr2):
     if arr1 is None and arr2 is None:
@@ -26,6 +63,7 @@ def _array_eq(arr1, arr2):
     )
 
 
+@_add_slots
 @dataclass(eq=False)
 class TransmissionJoint:
     name: str
@@ -47,6 +85,7 @@ class TransmissionJoint:
         )
 
 
+@_add_slots
 @dataclass(eq=False)
 class Actuator:
     name: str
@@ -71,6 +110,7 @@ class Actuator:
         )
 
 
+@_add_slots
 @dataclass(eq=False)
 class Transmission:
     name: str
@@ -95,12 +135,14 @@ class Transmission:
         )
 
 
+@_add_slots
 @dataclass
 class Calibration:
     rising: Optional[float] = None
     falling: Optional[float] = None
 
 
+@_add_slots
 @dataclass
 class Mimic:
     joint: str
@@ -108,6 +150,7 @@ class Mimic:
     offset: Optional[float] = None
 
 
+@_add_slots
 @dataclass
 class SafetyController:
     soft_lower_limit: Optional[float] = None
@@ -116,17 +159,20 @@ class SafetyController:
     k_velocity: Optional[float] = None
 
 
+@_add_slots
 @dataclass
 class Sphere:
     radius: float
 
 
+@_add_slots
 @dataclass
 class Cylinder:
     radius: float
     length: float
 
 
+@_add_slots
 @dataclass(eq=False)
 class Box:
     size: np.ndarray
@@ -137,6 +183,7 @@ class Box:
         return _array_eq(self.size, other.size)
 
 
+@_add_slots
 @dataclass(eq=False)
 class Mesh:
     filename: str
@@ -155,6 +202,7 @@ class Mesh:
         return _array_eq(self.scale, other.scale)
 
 
+@_add_slots
 @dataclass
 class Geometry:
     box: Optional[Box] = None
@@ -163,6 +211,7 @@ class Geometry:
     mesh: Optional[Mesh] = None
 
 
+@_add_slots
 @dataclass(eq=False)
 class Color:
     rgba: np.ndarray
@@ -173,11 +222,13 @@ class Color:
         return _array_eq(self.rgba, other.rgba)
 
 
+@_add_slots
 @dataclass
 class Texture:
     filename: str
 
 
+@_add_slots
 @dataclass
 class Material:
     name: Optional[str] = None
@@ -185,6 +236,7 @@ class Material:
     texture: Optional[Texture] = None
 
 
+@_add_slots
 @dataclass(eq=False)
 class Visual:
     name: Optional[str] = None
@@ -203,6 +255,7 @@ class Visual:
         )
 
 
+@_add_slots
 @dataclass(eq=False)
 class Collision:
     name: str = None
@@ -219,6 +272,7 @@ class Collision:
         )
 
 
+@_add_slots
 @dataclass(eq=False)
 class Inertial:
     origin: Optional[np.ndarray] = None
@@ -235,6 +289,7 @@ class Inertial:
         )
 
 
+@_add_slots
 @dataclass(eq=False)
 class Link:
     name: str
@@ -260,12 +315,14 @@ class Link:
         )
 
 
+@_add_slots
 @dataclass
 class Dynamics:
     damping: Optional[float] = None
     friction: Optional[float] = None
 
 
+@_add_slots
 @dataclass
 class Limit:
     effort: Optional[float] = None
@@ -274,6 +331,7 @@ class Limit:
     upper: Optional[float] = None
 
 
+@_add_slots
 @dataclass(eq=False)
 class Joint:
     name: str
@@ -306,6 +364,7 @@ class Joint:
         )
 
 
+@_add_slots
 @dataclass(eq=False)
 class Robot:
     name: str
@@ -393,6 +452,10 @@ class URDFSaveValidationError(URDFError):
     pass
 
 
+# Threshold for gimbal lock, same as trimesh.transformations
+_EULER_EPS = np.finfo(float).eps * 4.0
+
+
 def _str2float(s):
     """Cast string to float if it is not None. Otherwise return None.
 
@@ -405,6 +468,94 @@ def _str2float(s):
     return float(s) if s is not None else None
 
 
+def _str2vec(s):
+    """Cast string of whitespace-separated numbers to a float array.
+    The conversion happens inside NumPy instead of calling float() per element.
+
+    Args:
+        s (str): String to convert.
+
+    Returns:
+        np.ndarray: The converted numbers.
+    """
+    return np.array(s.split(), dtype=np.float64)
+
+
+def _vec2str(v):
+    """Cast a sequence of numbers to a string of whitespace-separated numbers, the inverse of _str2vec.
+    Arrays are converted to Python floats first, which format considerably faster than NumPy scalars
+    and yield the same shortest round-trip representation.
+
+    Args:
+        v (np.ndarray or list): Numbers to convert.
+
+    Returns:
+        str: The converted string.
+    """
+    if isinstance(v, np.ndarray):
+        v = v.tolist()
+    return " ".join(map(str, v))
+
+
+def _xyz_rpy_from_matrix(matrix):
+    """Decompose a homogeneous transformation into the xyz and rpy values of a URDF origin.
+    Same result as trimesh.transformations.translation_from_matrix and euler_from_matrix,
+    but computed on Python floats.
+
+    Args:
+        matrix ((4, 4) float): Homogeneous transformation.
+
+    Returns:
+        tuple[list[float], list[float]]: Translation and roll, pitch, yaw.
+    """
+    M = np.asarray(matrix, dtype=np.float64)[:3].tolist()
+
+    cy = math.sqrt(M[0][0] * M[0][0] + M[1][0] * M[1][0])
+    if cy > _EULER_EPS:
+        rpy = [
+            math.atan2(M[2][1], M[2][2]),
+            math.atan2(-M[2][0], cy),
+            math.atan2(M[1][0], M[0][0]),
+        ]
+    else:
+        rpy = [math.atan2(-M[1][2], M[1][1]), math.atan2(-M[2][0], cy), 0.0]
+
+    return [M[0][3], M[1][3], M[2][3]], rpy
+
+
+def _compose_xyz_rpy(xyz, rpy):
+    """Build the homogeneous transformation of a URDF origin in one go.
+    Same result as trimesh.transformations.compose_matrix(translate=xyz, angles=rpy), i.e.,
+    the static 'sxyz' Euler convention, but without creating and multiplying the
+    intermediate matrices.
+
+    Args:
+        xyz ((3) float): Translation.
+        rpy ((3) float): Roll, pitch, and yaw.
+
+    Returns:
+        (4, 4) float: Homogeneous transformation.
+    """
+    # scalar math on Python floats is cheaper than NumPy calls for three values
+    ai, aj, ak = np.asarray(rpy, dtype=np.float64)[:3].tolist()
+    x, y, z = np.asarray(xyz, dtype=np.float64)[:3].tolist()
+
+    si, sj, sk = math.sin(ai), math.sin(aj), math.sin(ak)
+    ci, cj, ck = math.cos(ai), math.cos(aj), math.cos(ak)
+    cc, cs = ci * ck, ci * sk
+    sc, ss = si * ck, si * sk
+
+    return np.array(
+        [
+            [cj * ck, sj * sc - cs, sj * cc + ss, x],
+            [cj * sk, sj * ss + cc, sj * cs - sc, y],
+            [-sj, cj * si, cj * ci, z],
+            [0.0, 0.0, 0.0, 1.0],
+        ],
+        dtype=np.float64,
+    )
+
+
 def apply_visual_color(
     geom: trimesh.Trimesh,
     visual: Visual,
@@ -445,6 +596,11 @@ def filename_handler_null(fname):
     return fname
 
 
+_URL_SEP = "://"
+_WINDOWS_SEP = ":\\\\"
+_PACKAGE_DIRECTIVE = "package://"
+
+
 def filename_handler_ignore_directive(fname):
     """A filename handler that removes anything before (and including) '://'.
 
@@ -454,8 +610,9 @@ def filename_handler_ignore_directive(fname):
     Returns:
         str: The file name without the prefix.
     """
-    if "://" in fname or ":\\\\" in fname:
-        return ":".join(fname.split(":")[1:])[2:]
+    if _URL_SEP in fname or _WINDOWS_SEP in fname:
+        # everything after the first ':', without the two separator characters
+        return fname.partition(":")[2][2:]
     return fname
 
 
@@ -469,10 +626,9 @@ def filename_handler_ignore_directive_package(fname):
     Returns:
         str: The file name without 'package://' and the package name.
     """
-    if fname.startswith("package://"):
-        string_length = len("package://")
+    if fname.startswith(_PACKAGE_DIRECTIVE):
         return os.path.join(
-            *os.path.normpath(fname[string_length:]).split(os.path.sep)[1:]
+            *os.path.normpath(fname[len(_PACKAGE_DIRECTIVE) :]).split(os.path.sep)[1:]
         )
     return filename_handler_ignore_directive(fname)
 
@@ -524,30 +680,93 @@ def filename_handler_relative_to_urdf_file(fname, urdf_fname):
 
 
 def filename_handler_relative_to_urdf_file_recursive(fname, urdf_fname, level=0):
-    if level == 0:
-        return filename_handler_relative_to_urdf_file(fname, urdf_fname)
-    return filename_handler_relative_to_urdf_file_recursive(
-        fname, os.path.split(urdf_fname)[0], level=level - 1
-    )
+    for _ in range(level):
+        urdf_fname = os.path.split(urdf_fname)[0]
+    return filename_handler_relative_to_urdf_file(fname, urdf_fname)
 
 
+@lru_cache(maxsize=None)
 def _create_filename_handlers_to_urdf_file_recursive(urdf_fname):
-    return [
-        partial(
-            filename_handler_relative_to_urdf_file_recursive,
-            urdf_fname=urdf_fname,
-            level=i,
-        )
-        for i in range(len(os.path.normpath(urdf_fname).split(os.path.sep)))
-    ]
+    # all parent directories of urdf_fname, up to the root
+    parents = [os.path.dirname(urdf_fname)]
+    while os.path.dirname(parents[-1]) != parents[-1]:
+        parents.append(os.path.dirname(parents[-1]))
+
+    return tuple(partial(filename_handler_relative, dir=p) for p in parents)
+
+
+def _list_files(dir):
+    """List the names of all files in a single directory with one os.scandir call.
+
+    Args:
+        dir (str): A directory.
+
+    Returns:
+        frozenset[str] or NoneType: Names of the files, None if the directory can't be listed.
+    """
+    try:
+        with os.scandir(dir) as entries:
+            return frozenset(e.name for e in entries if e.is_file())
+    except OSError:
+        return None
+
+
+class _FileSnapshot:
+    """Directories below a root directory, each listed on first access, to check for
+    existing files without a stat call per file. Files that aren't found in a listing are
+    checked with os.path.isfile once per snapshot, e.g., on case-insensitive file systems,
+    in directories that can't be listed or outside of the root directory.
+    """
 
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self._prefix = os.path.join(self.root, "")
+        self._files = {}
+        self._isfile = {}
+
+    def isfile(self, fname):
+        """Check whether a file exists.
+
+        Args:
+            fname (str): A file name.
+
+        Returns:
+            bool: Whether the file exists.
+        """
+        dirname, basename = os.path.split(os.path.abspath(fname))
+        if dirname == self.root or dirname.startswith(self._prefix):
+            if dirname not in self._files:
+                self._files[dirname] = _list_files(dirname)
+            files = self._files[dirname]
+            if files is not None and basename in files:
+                return True
+        if fname not in self._isfile:
+            self._isfile[fname] = os.path.isfile(fname)
+        return self._isfile[fname]
 
-def filename_handler_meta(fname, filename_handlers):
+
+def _file_exists(fname, file_snapshot=None):
+    """Check whether a file exists, using a directory snapshot if given.
+
+    Args:
+        fname (str): A file name.
+        file_snapshot (_FileSnapshot, optional): Listed directories used instead of os.path.isfile. Defaults to None.
+
+    Returns:
+        bool: Whether the file exists.
+    """
+    if file_snapshot is None:
+        return os.path.isfile(fname)
+    return file_snapshot.isfile(fname)
+
+
+def filename_handler_meta(fname, filename_handlers, file_snapshot=None):
     """A filename handler that calls other filename handlers until the resulting file name points to an existing file.
 
     Args:
         fname (str): A file name.
         filename_handlers (list(fn)): A list of function pointers to filename handlers.
+        file_snapshot (_FileSnapshot, optional): Listed directories used instead of os.path.isfile. Defaults to None.
 
     Returns:
         str: The resolved file name that points to an existing file or the input if none of the files exists.
@@ -555,18 +774,19 @@ def filename_handler_meta(fname, filename_handlers):
     for fn in filename_handlers:
         candidate_fname = fn(fname=fname)
         _logger.debug(f"Checking filename: {candidate_fname}")
-        if os.path.isfile(candidate_fname):
+        if _file_exists(candidate_fname, file_snapshot=file_snapshot):
             return candidate_fname
     _logger.warning(f"Unable to resolve filename: {fname}")
     return fname
 
 
-def filename_handler_magic(fname, dir):
+def filename_handler_magic(fname, dir, file_snapshot=None):
     """A magic filename handler.
 
     Args:
         fname (str): A file name.
         dir (str): A directory.
+        file_snapshot (_FileSnapshot, optional): Listed directories used instead of os.path.isfile. Defaults to None.
 
     Returns:
         str: The file name that exists or the input if nothing is found.
@@ -576,8 +796,9 @@ def filename_handler_magic(fname, dir):
         filename_handlers=[
             partial(filename_handler_relative, dir=dir),
             filename_handler_ignore_directive,
-        ]
-        + _create_filename_handlers_to_urdf_file_recursive(urdf_fname=dir),
+            *_create_filename_handlers_to_urdf_file_recursive(urdf_fname=dir),
+        ],
+        file_snapshot=file_snapshot,
     )
 
 
@@ -593,6 +814,280 @@ def validation_handler_strict(errors):
     return len(errors) == 0
 
 
+# Field names per dataclass type, used by URDF.contains and _clone
+_DATACLASS_FIELDS = {}
+
+
+def _clone(value):
+    """Copy a tree of URDF dataclasses. Faster than copy.deepcopy since only the dataclasses,
+    lists, and NumPy arrays are copied; all other values (strings, numbers) are immutable and shared.
+
+    Args:
+        value (Any): A dataclass (e.g., Link or Joint), list, NumPy array, or immutable value.
+
+    Returns:
+        Any: The copy.
+    """
+    if isinstance(value, list):
+        return [_clone(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return value.copy()
+
+    value_type = type(value)
+    if value_type not in _DATACLASS_FIELDS:
+        if not hasattr(value, "__dataclass_fields__"):
+            return value
+        _DATACLASS_FIELDS[value_type] = tuple(value.__dataclass_fields__)
+
+    return value_type(
+        **{f: _clone(getattr(value, f)) for f in _DATACLASS_FIELDS[value_type]}
+    )
+
+
+# Indices of (ixx, ixy, ixz, iyy, iyz, izz) that fill the symmetric 3x3 inertia matrix
+_INERTIA_INDICES = np.array([[0, 1, 2], [1, 3, 4], [2, 4, 5]])
+
+# Integer codes of joint types used by the vectorized forward kinematics
+_JOINT_TYPE_CODES = {
+    "revolute": 0,
+    "prismatic": 1,
+    "continuous": 2,
+    "fixed": 3,
+    "floating": 4,
+    "planar": 5,
+}
+
+# number of degrees of freedom of each joint type, fixed joints have none
+_JOINT_DOF_SIZES = {
+    "revolute": 1,
+    "prismatic": 1,
+    "continuous": 1,
+    "floating": 6,
+    "planar": 2,
+}
+
+
+def _fk_loop(origins, origin_is_identity, axes, K, KK, types, qs, out):
+    """Forward kinematics of all joints, written into a preallocated buffer.
+
+    Args:
+        origins ((n, 4, 4) float): Origin of each joint.
+        origin_is_identity ((n) bool): Whether the origin of each joint is the identity.
+        axes ((n, 3) float): Axis of each joint.
+        K ((n, 3, 3) float): Skew-symmetric matrix of each normalized joint axis.
+        KK ((n, 3, 3) float): K @ K of each joint.
+        types ((n) int): Type code of each joint, see _JOINT_TYPE_CODES.
+        qs ((n) float): Position of each joint.
+        out ((n, 4, 4) float): Homogeneous transformations from parent to child link of each joint.
+    """
+    for i in range(origins.shape[0]):
+        q = qs[i]
+
+        # motion of the joint as rotation m and translation t, kept in scalars
+        m00, m01, m02 = 1.0, 0.0, 0.0
+        m10, m11, m12 = 0.0, 1.0, 0.0
+        m20, m21, m22 = 0.0, 0.0, 1.0
+        t0, t1, t2 = 0.0, 0.0, 0.0
+
+        if types[i] == 0 or types[i] == 2:
+            # revolute or continuous: Rodrigues' formula
+            s = math.sin(q)
+            c = 1.0 - math.cos(q)
+            m00 = 1.0 + (s * K[i, 0, 0] + c * KK[i, 0, 0])
+            m01 = s * K[i, 0, 1] + c * KK[i, 0, 1]
+            m02 = s * K[i, 0, 2] + c * KK[i, 0, 2]
+            m10 = s * K[i, 1, 0] + c * KK[i, 1, 0]
+            m11 = 1.0 + (s * K[i, 1, 1] + c * KK[i, 1, 1])
+            m12 = s * K[i, 1, 2] + c * KK[i, 1, 2]
+            m20 = s * K[i, 2, 0] + c * KK[i, 2, 0]
+            m21 = s * K[i, 2, 1] + c * KK[i, 2, 1]
+            m22 = 1.0 + (s * K[i, 2, 2] + c * KK[i, 2, 2])
+        elif types[i] == 1:
+            # prismatic
+            t0 = q * axes[i, 0]
+            t1 = q * axes[i, 1]
+            t2 = q * axes[i, 2]
+
+        if origin_is_identity[i]:
+            out[i, 0, 0], out[i, 0, 1], out[i, 0, 2], out[i, 0, 3] = m00, m01, m02, t0
+            out[i, 1, 0], out[i, 1, 1], out[i, 1, 2], out[i, 1, 3] = m10, m11, m12, t1
+            out[i, 2, 0], out[i, 2, 1], out[i, 2, 2], out[i, 2, 3] = m20, m21, m22, t2
+        else:
+            # origin @ motion, the last row of both is (0, 0, 0, 1)
+            for r in range(3):
+                o0, o1, o2 = origins[i, r, 0], origins[i, r, 1], origins[i, r, 2]
+                out[i, r, 0] = o0 * m00 + o1 * m10 + o2 * m20
+                out[i, r, 1] = o0 * m01 + o1 * m11 + o2 * m21
+                out[i, r, 2] = o0 * m02 + o1 * m12 + o2 * m22
+                out[i, r, 3] = origins[i, r, 3] + o0 * t0 + o1 * t1 + o2 * t2
+
+        out[i, 3, 0], out[i, 3, 1], out[i, 3, 2], out[i, 3, 3] = 0.0, 0.0, 0.0, 1.0
+
+
+# Fall back to the NumPy implementation (URDF._fk_batch) if numba is not available
+_fk_kernel = numba.njit(cache=True)(_fk_loop) if numba is not None else None
+
+
+def _build_fk_jax(
+    num_links,
+    cfg_joint_indices,
+    cfg_dof_indices,
+    mimic_indices,
+    mimic_src_indices,
+    mimic_mul,
+    mimic_off,
+    origins,
+    axes,
+    K,
+    KK,
+    types,
+    joint_order,
+    parent_link_indices,
+    child_link_indices,
+):
+    """Build a jitted JAX function for batched forward kinematics, see URDF.fk_jax.
+    The arguments are the structure-of-arrays representation of the URDF model.
+
+    Returns:
+        Callable: Maps (b, m) configurations to (b, l, 4, 4) link transformations.
+    """
+    import jax
+    import jax.numpy as jnp
+
+    num_joints = len(types)
+    origins, axes, K, KK = map(jnp.asarray, (origins, axes, K, KK))
+    rotational = jnp.asarray(
+        (types == _JOINT_TYPE_CODES["revolute"])
+        | (types == _JOINT_TYPE_CODES["continuous"])
+    )
+    prismatic = jnp.asarray(types == _JOINT_TYPE_CODES["prismatic"])
+    joint_order = np.asarray(joint_order, dtype=np.int32)
+    scan_inputs = (
+        jnp.asarray(parent_link_indices[joint_order]),
+        jnp.asarray(child_link_indices[joint_order]),
+        jnp.asarray(joint_order),
+    )
+
+    def fk_single(cfg):
+        qs = jnp.zeros(num_joints, dtype=cfg.dtype)
+        qs = qs.at[cfg_joint_indices].set(cfg[cfg_dof_indices])
+        qs = qs.at[mimic_indices].set(qs[mimic_src_indices] * mimic_mul + mimic_off)
+
+        # Rodrigues' formula for rotational joints,
+        # translation along the axis for prismatic ones
+        R = (
+            jnp.eye(3)
+            + jnp.sin(qs)[:, None, None] * K
+            + (1.0 - jnp.cos(qs))[:, None, None] * KK
+        )
+        R = jnp.where(rotational[:, None, None], R, jnp.eye(3))
+        t = jnp.where(prismatic[:, None], qs[:, None] * axes, 0.0)
+        motions = (
+            jnp.zeros((num_joints, 4, 4), dtype=R.dtype)
+            .at[:, :3, :3]
+            .set(R)
+            .at[:, :3, 3]
+            .set(t)
+            .at[:, 3, 3]
+            .set(1.0)
+        )
+        joint_transforms = jnp.matmul(origins, motions)
+
+        def step(link_transforms, x):
+            parent, child, joint = x
+            link_transforms = link_transforms.at[child].set(
+                link_transforms[parent] @ joint_transforms[joint]
+            )
+            return link_transforms, None
+
+        link_transforms = jnp.tile(jnp.eye(4, dtype=R.dtype), (num_links, 1, 1))
+        if len(joint_order) > 0:
+            # unrolling short chains speeds up execution at little extra compile time
+            link_transforms, _ = jax.lax.scan(
+                step,
+                link_transforms,
+                scan_inputs,
+                unroll=len(joint_order) if len(joint_order) <= 32 else 1,
+            )
+        return link_transforms
+
+    return jax.jit(jax.vmap(fk_single))
+
+
+class _TargetElement:
+    """Lightweight stand-in for the subset of the lxml element API used by the URDF._parse_* methods."""
+
+    __slots__ = ("tag", "attrib", "text", "children")
+
+    def __init__(self, tag, attrib):
+        self.tag = tag
+        self.attrib = attrib
+        self.text = None
+        self.children = []
+
+    def __getitem__(self, index):
+        return self.children[index]
+
+    def get(self, key, default=None):
+        return self.attrib.get(key, default)
+
+    def find(self, tag):
+        for child in self.children:
+            if child.tag == tag:
+                return child
+        return None
+
+    def findall(self, tag):
+        return [child for child in self.children if child.tag == tag]
+
+    def __iter__(self):
+        return iter(self.children)
+
+
+class _URDFTarget:
+    """Parser target for lxml's XMLParser that turns the URDF into a Robot while parsing.
+
+    Each top-level <link>, <joint>, and <material> is converted into its dataclass as soon as
+    its end tag is reached and then dropped, i.e., no lxml tree is built.
+    """
+
+    def __init__(self):
+        self._stack = []
+        self._robot = None
+        self._parsers = {
+            "link": ([], URDF._parse_link),
+            "joint": ([], URDF._parse_joint),
+            "material": ([], URDF._parse_material),
+        }
+
+    def start(self, tag, attrib):
+        element = _TargetElement(tag, dict(attrib))
+        if len(self._stack) > 1:
+            self._stack[-1].children.append(element)
+        self._stack.append(element)
+
+    def end(self, tag):
+        element = self._stack.pop()
+        if len(self._stack) == 1 and tag in self._parsers:
+            elements, parse_fn = self._parsers[tag]
+            elements.append(parse_fn(element))
+        elif not self._stack:
+            self._robot = Robot(
+                name=element.attrib["name"],
+                links=self._parsers["link"][0],
+                joints=self._parsers["joint"][0],
+                materials=self._parsers["material"][0],
+            )
+
+    def data(self, data):
+        element = self._stack[-1] if self._stack else None
+        if element is not None and not element.children:
+            element.text = data if element.text is None else element.text + data
+
+    def close(self):
+        return self._robot
+
+
 class URDF:
     def __init__(
         self,
@@ -614,19 +1109,25 @@ class URDF:
             build_collision_scene_graph (bool, optional): Wheter to build a scene graph for <collision> elements. Defaults to False.
             load_meshes (bool, optional): Whether to load the meshes referenced in the <mesh> elements. Defaults to True.
             load_collision_meshes (bool, optional): Whether to load the collision meshes referenced in the <mesh> elements. Defaults to False.
-            filename_handler ([type], optional): Any function f(in: str) -> str, that maps filenames in the URDF to actual resources. Can be used to customize treatment of `package://` directives or relative/absolute filenames. Defaults to None.
+            filename_handler ([type], optional): Any function f(in: str) -> str, that maps filenames in the URDF to actual resources. Can be used to customize treatment of `package://` directives or relative/absolute filenames. Results are cached per filename. Defaults to None.
             mesh_dir (str, optional): A root directory used for loading meshes. Defaults to "".
             force_mesh (bool, optional): Each loaded geometry will be concatenated into a single one (instead of being turned into a graph; in case the underlying file contains multiple geometries). This might loose texture information but the resulting scene graph will be smaller. Defaults to False.
             force_collision_mesh (bool, optional): Same as force_mesh, but for collision scene. Defaults to True.
         """
         if filename_handler is None:
-            self._filename_handler = partial(filename_handler_magic, dir=mesh_dir)
-        else:
-            self._filename_handler = filename_handler
+            filename_handler = partial(
+                filename_handler_magic,
+                dir=mesh_dir,
+                # directories are listed on the first resolved filename, not here
+                file_snapshot=_FileSnapshot(mesh_dir) if mesh_dir else None,
+            )
+        self._filename_handler = lru_cache(maxsize=4096)(filename_handler)
+        self._mesh_dir = mesh_dir
 
         self.robot = robot
         self._create_maps()
         self._update_actuated_joints()
+        self._update_joint_arrays()
 
         self._cfg = self.zero_cfg
 
@@ -637,6 +1138,14 @@ class URDF:
 
         self._errors = []
 
+        # loaded mesh files and their remaining references in the scene that is created,
+        # a file is only kept in the cache until its last reference
+        self._mesh_cache = {}
+        self._mesh_references = {}
+
+        # successors of each node in the scene graph, see _successors
+        self._successors_cache = {}
+
         if build_scene_graph:
             self._scene = self._create_scene(
                 use_collision_geometry=False,
@@ -657,6 +1166,9 @@ class URDF:
         else:
             self._scene_collision = None
 
+        self._mesh_cache.clear()
+        self._mesh_references.clear()
+
     @property
     def scene(self) -> trimesh.Scene:
         """A scene object representing the URDF model.
@@ -695,12 +1207,12 @@ class URDF:
 
     @property
     def joint_names(self):
-        """List of joint names.
+        """Joint names. They are computed once during construction, i.e., the joints of the model are treated as immutable.
 
         Returns:
-            list[str]: List of joint names of the URDF model.
+            tuple[str]: Joint names of the URDF model.
         """
-        return [j.name for j in self.robot.joints]
+        return self._joint_names
 
     @property
     def actuated_joints(self):
@@ -731,12 +1243,12 @@ class URDF:
 
     @property
     def actuated_joint_names(self):
-        """List of names of actuated joints. This excludes mimic and fixed joints.
+        """Names of actuated joints. This excludes mimic and fixed joints. They are computed once during construction, i.e., the joints of the model are treated as immutable.
 
         Returns:
-            list[str]: List of names of actuated joints of the URDF model.
+            tuple[str]: Names of actuated joints of the URDF model.
         """
-        return [j.name for j in self._actuated_joints]
+        return self._actuated_joint_names
 
     @property
     def num_actuated_joints(self):
@@ -754,15 +1266,7 @@ class URDF:
         Returns:
             int: Degrees of freedom.
         """
-        total_num_dofs = 0
-        for j in self._actuated_joints:
-            if j.type in ["revolute", "prismatic", "continuous"]:
-                total_num_dofs += 1
-            elif j.type == "floating":
-                total_num_dofs += 6
-            elif j.type == "planar":
-                total_num_dofs += 2
-        return total_num_dofs
+        return int(self._joint_dof_offsets[-1])
 
     @property
     def zero_cfg(self):
@@ -780,32 +1284,13 @@ class URDF:
         Returns:
             (n), float: Default configuration of URDF model.
         """
-        config = []
-        config_names = []
-        for j in self._actuated_joints:
-            if j.type == "revolute" or j.type == "prismatic":
-                if j.limit is not None:
-                    cfg = [j.limit.lower + 0.5 * (j.limit.upper - j.limit.lower)]
-                else:
-                    cfg = [0.0]
-            elif j.type == "continuous":
-                cfg = [0.0]
-            elif j.type == "floating":
-                cfg = [0.0] * 6
-            elif j.type == "planar":
-                cfg = [0.0] * 2
-
-            config.append(cfg)
-            config_names.append(j.name)
-
-        for i, j in enumerate(self.robot.joints):
-            if j.mimic is not None:
-                index = config_names.index(j.mimic.joint)
-                config[i][0] = config[index][0] * j.mimic.multiplier + j.mimic.offset
-
-        if len(config) == 0:
-            return np.array([], dtype=np.float64)
-        return np.concatenate(config)
+        config = np.zeros(self.num_dofs)
+        indices = self._center_cfg_joint_indices
+        # missing lower/upper attributes default to 0 as in the URDF specification
+        lower = np.nan_to_num(self._joint_limit_lower[indices], nan=0.0)
+        upper = np.nan_to_num(self._joint_limit_upper[indices], nan=0.0)
+        config[self._joint_dof_offsets[indices]] = lower + 0.5 * (upper - lower)
+        return config
 
     @property
     def cfg(self):
@@ -893,6 +1378,11 @@ class URDF:
         for l in self.robot.links:
             self._link_map[l.name] = l
 
+        self._joint_names = tuple(j.name for j in self.robot.joints)
+        self._joint_name_to_index = {
+            name: i for i, name in enumerate(self._joint_names)
+        }
+
     def _update_actuated_joints(self):
         self._actuated_joints = []
         self._actuated_joint_indices = []
@@ -918,6 +1408,180 @@ class URDF:
                     )
                     dof_indices_cnt += 2
 
+        # degrees of freedom of each joint in the configuration vector of center_cfg
+        # and zero_cfg, and the offset of each joint's first entry
+        self._joint_dof_sizes = np.array(
+            [
+                0 if j.mimic is not None else _JOINT_DOF_SIZES.get(j.type, 0)
+                for j in self.robot.joints
+            ],
+            dtype=np.intp,
+        )
+        self._joint_dof_offsets = np.concatenate(
+            [[0], np.cumsum(self._joint_dof_sizes)]
+        ).astype(np.intp)
+
+        self._actuated_joint_names = tuple(j.name for j in self._actuated_joints)
+        self._actuated_joint_name_to_index = {
+            name: i for i, name in enumerate(self._actuated_joint_names)
+        }
+
+        # joints whose position is a single entry of the configuration vector
+        self._cfg_joint_indices = np.array(
+            [
+                i
+                for i, j in zip(self._actuated_joint_indices, self._actuated_joints)
+                if j.type in ["prismatic", "revolute", "continuous"]
+            ],
+            dtype=np.intp,
+        )
+        self._cfg_dof_indices = np.array(
+            [
+                dof_indices[0]
+                for j, dof_indices in zip(
+                    self._actuated_joints, self._actuated_dof_indices
+                )
+                if j.type in ["prismatic", "revolute", "continuous"]
+            ],
+            dtype=np.intp,
+        )
+
+        self._actuated_joints_single_dof = len(self._cfg_joint_indices) == len(
+            self._actuated_joints
+        )
+
+        # mimic joint positions:
+        # q[mimic_indices] = q[mimic_src_indices] * mimic_mul + mimic_off
+        mimic_indices, mimic_src_indices, mimic_mul, mimic_off = [], [], [], []
+        for i, j in enumerate(self.robot.joints):
+            if j.mimic is None:
+                continue
+
+            mimic_indices.append(i)
+            mimic_off.append(j.mimic.offset)
+            if j.mimic.joint in self._actuated_joint_name_to_index:
+                mimic_src_indices.append(self._joint_name_to_index[j.mimic.joint])
+                mimic_mul.append(j.mimic.multiplier)
+            else:
+                _logger.warning(
+                    f"Joint '{j.name}' is supposed to mimic '{j.mimic.joint}'. But this joint is not actuated - will assume (0.0 + offset)."
+                )
+                # constant offset
+                mimic_src_indices.append(i)
+                mimic_mul.append(0.0)
+
+        self._mimic_indices = np.array(mimic_indices, dtype=np.intp)
+        self._mimic_src_indices = np.array(mimic_src_indices, dtype=np.intp)
+        self._mimic_mul = np.array(mimic_mul, dtype=np.float64)
+        self._mimic_off = np.array(mimic_off, dtype=np.float64)
+
+        self._joint_positions_buffer = np.zeros(len(self.robot.joints))
+
+    def _update_joint_arrays(self):
+        # Structure-of-arrays representation of the joints for batched
+        # forward kinematics
+        num_joints = len(self.robot.joints)
+
+        self._joint_origins = np.tile(_EYE4, (num_joints, 1, 1))
+        self._joint_origin_is_identity = np.ones(num_joints, dtype=bool)
+        self._joint_axes = np.zeros((num_joints, 3))
+        self._joint_type_code = np.full(
+            num_joints, _JOINT_TYPE_CODES["fixed"], dtype=np.int8
+        )
+
+        # links connected by each joint as indices into self.robot.links, -1 if unknown
+        link_indices = {l.name: i for i, l in enumerate(self.robot.links)}
+        self._joint_parent_link_indices = np.full(num_joints, -1, dtype=np.int32)
+        self._joint_child_link_indices = np.full(num_joints, -1, dtype=np.int32)
+
+        # joint limits, NaN if not specified
+        self._joint_limit_lower = np.full(num_joints, np.nan)
+        self._joint_limit_upper = np.full(num_joints, np.nan)
+
+        for i, j in enumerate(self.robot.joints):
+            if j.origin is not None:
+                self._joint_origins[i] = j.origin
+                self._joint_origin_is_identity[i] = np.array_equal(j.origin, _EYE4)
+            if j.axis is not None:
+                self._joint_axes[i] = j.axis
+            if j.type in _JOINT_TYPE_CODES:
+                self._joint_type_code[i] = _JOINT_TYPE_CODES[j.type]
+            self._joint_parent_link_indices[i] = link_indices.get(j.parent, -1)
+            self._joint_child_link_indices[i] = link_indices.get(j.child, -1)
+            if j.limit is not None:
+                if j.limit.lower is not None:
+                    self._joint_limit_lower[i] = j.limit.lower
+                if j.limit.upper is not None:
+                    self._joint_limit_upper[i] = j.limit.upper
+
+        # order of the joints such that each parent link is reached before its children
+        parents = self._joint_parent_link_indices.tolist()
+        children = self._joint_child_link_indices.tolist()
+        joints_of_parent = {}
+        for i in range(num_joints):
+            if parents[i] >= 0 and children[i] >= 0:
+                joints_of_parent.setdefault(parents[i], []).append(i)
+        visited = set(range(len(self.robot.links))) - set(children)
+        stack = sorted(visited, reverse=True)
+        self._fk_joint_order = []
+        while stack:
+            for i in joints_of_parent.get(stack.pop(), []):
+                child = children[i]
+                if child not in visited:
+                    visited.add(child)
+                    self._fk_joint_order.append(i)
+                    stack.append(child)
+
+        # entries of the configuration vector that are centered between the joint limits
+        self._center_cfg_joint_indices = np.flatnonzero(
+            (
+                (self._joint_type_code == _JOINT_TYPE_CODES["revolute"])
+                | (self._joint_type_code == _JOINT_TYPE_CODES["prismatic"])
+            )
+            & (self._joint_dof_sizes > 0)
+            & np.array([j.limit is not None for j in self.robot.joints], dtype=bool)
+        )
+
+        # q-independent part of Rodrigues' formula: skew-symmetric matrix K of the
+        # normalized axis and K @ K = a a^T - I
+        norms = np.linalg.norm(self._joint_axes, axis=1, keepdims=True)
+        a = np.divide(
+            self._joint_axes,
+            norms,
+            out=np.zeros_like(self._joint_axes),
+            where=norms > 0,
+        )
+        self._joint_K = np.zeros((num_joints, 3, 3))
+        self._joint_K[:, 0, 1] = -a[:, 2]
+        self._joint_K[:, 0, 2] = a[:, 1]
+        self._joint_K[:, 1, 0] = a[:, 2]
+        self._joint_K[:, 1, 2] = -a[:, 0]
+        self._joint_K[:, 2, 0] = -a[:, 1]
+        self._joint_K[:, 2, 1] = a[:, 0]
+        self._joint_KK = np.einsum("ni,nj->nij", a, a) - np.eye(3)
+
+        # joints grouped by the part of the forward kinematics they need
+        self._rotational_joint_indices = np.flatnonzero(
+            (self._joint_type_code == _JOINT_TYPE_CODES["revolute"])
+            | (self._joint_type_code == _JOINT_TYPE_CODES["continuous"])
+        )
+        self._rotational_K = self._joint_K[self._rotational_joint_indices]
+        self._rotational_KK = self._joint_KK[self._rotational_joint_indices]
+        self._prismatic_joint_indices = np.flatnonzero(
+            self._joint_type_code == _JOINT_TYPE_CODES["prismatic"]
+        )
+        self._prismatic_axes = self._joint_axes[self._prismatic_joint_indices]
+        self._origin_joint_indices = np.flatnonzero(~self._joint_origin_is_identity)
+        self._nonidentity_origins = self._joint_origins[self._origin_joint_indices]
+
+        self._out_matrices = np.empty((num_joints, 4, 4))
+
+        # scene graph edge of each joint
+        self._fk_edges = [(j.parent, j.child) for j in self.robot.joints]
+
+        # built on first use, see fk_jax
+        self._fk_jax = None
+
     def _validate_required_attribute(self, attribute, error_msg, allowed_values=None):
         if attribute is None:
             self._errors.append(URDFIncompleteError(error_msg))
@@ -933,7 +1597,7 @@ class URDF:
         """Load URDF file from filename or file object.
 
         Args:
-            fname_or_file (str or file object): A filename or file object, file-like object, stream representing the URDF file.
+            fname_or_file (str, os.PathLike or file object): A filename or file object, file-like object, stream representing the URDF file.
             **build_scene_graph (bool, optional): Wheter to build a scene graph to enable transformation queries and forward kinematics. Defaults to True.
             **build_collision_scene_graph (bool, optional): Wheter to build a scene graph for <collision> elements. Defaults to False.
             **load_meshes (bool, optional): Whether to load the meshes referenced in the <mesh> elements. Defaults to True.
@@ -942,6 +1606,7 @@ class URDF:
             **mesh_dir (str, optional): A root directory used for loading meshes. Defaults to "".
             **force_mesh (bool, optional): Each loaded geometry will be concatenated into a single one (instead of being turned into a graph; in case the underlying file contains multiple geometries). This might loose texture information but the resulting scene graph will be smaller. Defaults to False.
             **force_collision_mesh (bool, optional): Same as force_mesh, but for collision scene. Defaults to True.
+            **fast (bool, optional): Whether to parse the URDF with an lxml target parser that creates the dataclasses directly instead of building lxml elements. Defaults to False.
 
         Raises:
             ValueError: If filename does not exist.
@@ -949,6 +1614,9 @@ class URDF:
         Returns:
             yourdfpy.URDF: URDF model.
         """
+        if isinstance(fname_or_file, os.PathLike):
+            fname_or_file = os.fspath(fname_or_file)
+
         if isinstance(fname_or_file, six.string_types):
             if not os.path.isfile(fname_or_file):
                 raise ValueError("{} is not a file".format(fname_or_file))
@@ -956,37 +1624,23 @@ class URDF:
             if not "mesh_dir" in kwargs:
                 kwargs["mesh_dir"] = os.path.dirname(fname_or_file)
 
+        fast = kwargs.pop("fast", False)
+
         try:
-            parser = etree.XMLParser(remove_blank_text=True)
-            tree = etree.parse(fname_or_file, parser=parser)
-            xml_root = tree.getroot()
-        except Exception as e:
+            if fast:
+                robot = URDF._parse_robot_target(fname_or_file)
+            else:
+                robot = URDF._parse_robot_stream(fname_or_file)
+        except etree.XMLSyntaxError as e:
             _logger.error(e)
             _logger.error("Using different parsing approach.")
 
-            events = ("start", "end", "start-ns", "end-ns")
-            xml = etree.iterparse(fname_or_file, recover=True, events=events)
-
-            # Iterate through all XML elements
-            for action, elem in xml:
-                # Skip comments and processing instructions,
-                # because they do not have names
-                if not (
-                    isinstance(elem, etree._Comment)
-                    or isinstance(elem, etree._ProcessingInstruction)
-                ):
-                    # Remove a namespace URI in the element's name
-                    # elem.tag = etree.QName(elem).localname
-                    if action == "end" and ":" in elem.tag:
-                        elem.getparent().remove(elem)
-
-            xml_root = xml.root
+            if hasattr(fname_or_file, "seek"):
+                fname_or_file.seek(0)
 
-        # Remove comments
-        etree.strip_tags(xml_root, etree.Comment)
-        etree.cleanup_namespaces(xml_root)
+            robot = URDF._parse_robot_stream(fname_or_file, recover=True)
 
-        return URDF(robot=URDF._parse_robot(xml_element=xml_root), **kwargs)
+        return URDF(robot=robot, **kwargs)
 
     def contains(self, key, value, element=None) -> bool:
         """Checks recursively whether the URDF tree contains the provided key-value pair.
@@ -1002,26 +1656,28 @@ class URDF:
         if element is None:
             element = self.robot
 
-        result = False
-        for field in element.__dataclass_fields__:
-            field_value = getattr(element, field)
-            if is_dataclass(field_value):
-                result = result or self.contains(
-                    key=key, value=value, element=field_value
-                )
-            elif (
-                isinstance(field_value, list)
-                and len(field_value) > 0
-                and is_dataclass(field_value[0])
-            ):
-                for field_value_element in field_value:
-                    result = result or self.contains(
-                        key=key, value=value, element=field_value_element
-                    )
-            else:
-                if key == field and value == field_value:
-                    result = True
-        return result
+        # iterative depth-first search
+        stack = [element]
+        while stack:
+            element = stack.pop()
+
+            element_type = type(element)
+            if element_type not in _DATACLASS_FIELDS:
+                _DATACLASS_FIELDS[element_type] = tuple(element.__dataclass_fields__)
+
+            for field_name in _DATACLASS_FIELDS[element_type]:
+                field_value = getattr(element, field_name)
+                if hasattr(field_value, "__dataclass_fields__"):
+                    stack.append(field_value)
+                elif (
+                    isinstance(field_value, list)
+                    and len(field_value) > 0
+                    and hasattr(field_value[0], "__dataclass_fields__")
+                ):
+                    stack.extend(field_value)
+                elif key == field_name and value == field_value:
+                    return True
+        return False
 
     def _determine_base_link(self):
         """Get the base link of the URDF tree by extracting all links without parents.
@@ -1041,40 +1697,169 @@ class URDF:
 
         return link_names[0]
 
-    def _forward_kinematics_joint(self, joint, q=None):
-        origin = np.eye(4) if joint.origin is None else joint.origin
+    def _joint_positions(self, cfg=None):
+        """Get the position of each joint based on a configuration vector, including mimic joints.
+        Fixed, floating, and planar joints are set to zero.
 
-        if joint.mimic is not None:
-            if joint.mimic.joint in self.actuated_joint_names:
-                mimic_joint_index = self.actuated_joint_names.index(joint.mimic.joint)
-                q = (
-                    self._cfg[mimic_joint_index] * joint.mimic.multiplier
-                    + joint.mimic.offset
-                )
-            else:
-                _logger.warning(
-                    f"Joint '{joint.name}' is supposed to mimic '{joint.mimic.joint}'. But this joint is not actuated - will assume (0.0 + offset)."
-                )
-                q = 0.0 + joint.mimic.offset
-
-        if joint.type in ["revolute", "prismatic", "continuous"]:
-            if q is None:
-                # Use internal cfg vector for forward kinematics
-                q = self.cfg[
-                    self.actuated_dof_indices[
-                        self.actuated_joint_names.index(joint.name)
-                    ]
-                ]
+        Args:
+            cfg ((..., m) float, optional): Configuration vector(s). None means the internal configuration vector. Defaults to None.
 
-            if joint.type == "prismatic":
-                matrix = origin @ tra.translation_matrix(q * joint.axis)
-            else:
-                matrix = origin @ tra.rotation_matrix(float(q), joint.axis)
+        Returns:
+            (..., n), float: Position of each joint in self.robot.joints.
+        """
+        if cfg is None:
+            # all other entries of the buffer stay zero
+            qs = self._joint_positions_buffer
+            cfg = self._cfg
         else:
-            # this includes: floating, planar, fixed
-            matrix = origin
+            qs = np.zeros(cfg.shape[:-1] + (len(self.robot.joints),))
+
+        qs[..., self._cfg_joint_indices] = cfg[..., self._cfg_dof_indices]
+        if len(self._mimic_indices) > 0:
+            qs[..., self._mimic_indices] = (
+                qs[..., self._mimic_src_indices] * self._mimic_mul + self._mimic_off
+            )
+        return qs
+
+    def _forward_kinematics(self, qs):
+        """Forward kinematics of all joints.
+
+        Args:
+            qs ((n) float): Position of each joint, see _joint_positions.
+
+        Returns:
+            (n, 4, 4) float: Homogeneous transformations from parent to child link of each joint.
+        """
+        if _fk_kernel is not None:
+            _fk_kernel(
+                self._joint_origins,
+                self._joint_origin_is_identity,
+                self._joint_axes,
+                self._joint_K,
+                self._joint_KK,
+                self._joint_type_code,
+                qs,
+                self._out_matrices,
+            )
+            return self._out_matrices
+
+        return self._fk_batch(qs)
+
+    def _fk_batch(self, qs, out=None):
+        """Forward kinematics of all joints with batched NumPy operations.
+
+        Args:
+            qs ((..., n) float): Position of each joint, optionally for a batch of configurations. Ignored for fixed, floating, and planar joints.
+            out ((..., n, 4, 4) float, optional): Output buffer. None means self._out_matrices, which requires a single configuration. Defaults to None.
+
+        Returns:
+            (..., n, 4, 4) float: Homogeneous transformations from parent to child link of each joint.
+        """
+        qs = np.asarray(qs, dtype=np.float64)
+        if out is None:
+            out = self._out_matrices
+        out[...] = _EYE4
+
+        # Rodrigues' formula: R = I + sin(q) K + (1 - cos(q)) K @ K
+        q = qs[..., self._rotational_joint_indices]
+        out[..., self._rotational_joint_indices, :3, :3] = (
+            np.eye(3)
+            + np.sin(q)[..., None, None] * self._rotational_K
+            + (1.0 - np.cos(q))[..., None, None] * self._rotational_KK
+        )
+
+        # slice the last axis, an integer index would move the joint axis to the front
+        out[..., self._prismatic_joint_indices, :3, 3:] = (
+            qs[..., self._prismatic_joint_indices, None, None]
+            * self._prismatic_axes[:, :, None]
+        )
+
+        # no need to compose with identity origins
+        out[..., self._origin_joint_indices, :, :] = np.matmul(
+            self._nonidentity_origins, out[..., self._origin_joint_indices, :, :]
+        )
+        return out
+
+    def compute_link_transforms(self, configurations):
+        """Forward kinematics of many configurations at once. Neither the current configuration nor the scene graph are changed.
+
+        Args:
+            configurations ((b, n) or (n) float): Configurations, each of the same form as cfg.
+
+        Raises:
+            ValueError: Raised if dimensionality of configurations does not match the one of cfg.
 
-        return matrix, q
+        Returns:
+            (b, l, 4, 4) or (l, 4, 4) float: Homogeneous transformation of each link in robot.links w.r.t. the base link, for each configuration.
+        """
+        configurations = np.asarray(configurations, dtype=np.float64)
+        single = configurations.ndim == 1
+        configurations = np.atleast_2d(configurations)
+        if configurations.ndim != 2 or configurations.shape[1] != len(self._cfg):
+            raise ValueError(
+                f"Shape of configurations {configurations.shape} doesn't match (b, {len(self._cfg)})."
+            )
+
+        num_configurations = len(configurations)
+        joint_transforms = self._fk_batch(
+            self._joint_positions(configurations),
+            out=np.empty((num_configurations, len(self.robot.joints), 4, 4)),
+        )
+
+        # scan over joints from the root links down,
+        # links without parent stay at the identity
+        link_transforms = np.tile(
+            _EYE4, (num_configurations, len(self.robot.links), 1, 1)
+        )
+        for i in self._fk_joint_order:
+            link_transforms[:, self._joint_child_link_indices[i]] = np.matmul(
+                link_transforms[:, self._joint_parent_link_indices[i]],
+                joint_transforms[:, i],
+            )
+
+        return link_transforms[0] if single else link_transforms
+
+    def fk_jax(self, configurations):
+        """Batched forward kinematics with JAX, e.g., to run many configurations on a GPU.
+        Same result as compute_link_transforms. The function is jit-compiled on the first call;
+        its precision follows JAX's default floating point type (float32 unless jax_enable_x64 is set).
+
+        Args:
+            configurations ((b, n) float): Configurations, each of the same form as cfg.
+
+        Raises:
+            ImportError: Raised if JAX is not installed.
+
+        Returns:
+            jax.Array: (b, l, 4, 4) homogeneous transformation of each link in robot.links w.r.t. the base link, for each configuration.
+        """
+        try:
+            import jax.numpy as jnp
+        except ImportError as e:
+            raise ImportError(
+                "fk_jax requires JAX. Install it via `pip install yourdfpy[jax]`."
+            ) from e
+
+        if self._fk_jax is None:
+            self._fk_jax = _build_fk_jax(
+                num_links=len(self.robot.links),
+                cfg_joint_indices=self._cfg_joint_indices,
+                cfg_dof_indices=self._cfg_dof_indices,
+                mimic_indices=self._mimic_indices,
+                mimic_src_indices=self._mimic_src_indices,
+                mimic_mul=self._mimic_mul,
+                mimic_off=self._mimic_off,
+                origins=self._joint_origins,
+                axes=self._joint_axes,
+                K=self._joint_K,
+                KK=self._joint_KK,
+                types=self._joint_type_code,
+                joint_order=self._fk_joint_order,
+                parent_link_indices=self._joint_parent_link_indices,
+                child_link_indices=self._joint_child_link_indices,
+            )
+
+        return self._fk_jax(jnp.asarray(configurations))
 
     def update_cfg(self, configuration):
         """Update joint configuration of URDF; does forward kinematics.
@@ -1087,6 +1872,8 @@ class URDF:
             TypeError: Raised if configuration is neither a dict, list, tuple or np.ndarray.
         """
         joint_cfg = []
+        # values of all actuated joints in order, if each of them has a single dof
+        cfg_values = None
 
         if isinstance(configuration, dict):
             for joint in configuration:
@@ -1097,11 +1884,19 @@ class URDF:
                     joint_cfg.append((joint, configuration[joint]))
         elif isinstance(configuration, (list, tuple, np.ndarray)):
             if len(configuration) == len(self.robot.joints):
-                for joint, value in zip(self.robot.joints, configuration):
-                    joint_cfg.append((joint, value))
+                if self._actuated_joints_single_dof:
+                    cfg_values = [
+                        configuration[i] for i in self._actuated_joint_indices
+                    ]
+                else:
+                    for joint, value in zip(self.robot.joints, configuration):
+                        joint_cfg.append((joint, value))
             elif len(configuration) == self.num_actuated_joints:
-                for joint, value in zip(self._actuated_joints, configuration):
-                    joint_cfg.append((joint, value))
+                if self._actuated_joints_single_dof:
+                    cfg_values = configuration
+                else:
+                    for joint, value in zip(self._actuated_joints, configuration):
+                        joint_cfg.append((joint, value))
             else:
                 raise ValueError(
                     f"Dimensionality of configuration ({len(configuration)}) doesn't match number of all ({len(self.robot.joints)}) or actuated joints ({self.num_actuated_joints})."
@@ -1109,26 +1904,41 @@ class URDF:
         else:
             raise TypeError("Invalid type for configuration")
 
-        # append all mimic joints in the update
-        for j, q in joint_cfg + [
-            (j, 0.0) for j in self.robot.joints if j.mimic is not None
-        ]:
-            matrix, joint_q = self._forward_kinematics_joint(j, q=q)
-
-            # update internal configuration vector - only consider actuated joints
-            if j.name in self.actuated_joint_names:
-                self._cfg[
-                    self.actuated_dof_indices[self.actuated_joint_names.index(j.name)]
-                ] = joint_q
-
-            if self._scene is not None:
-                self._scene.graph.update(
-                    frame_from=j.parent, frame_to=j.child, matrix=matrix
-                )
-            if self._scene_collision is not None:
-                self._scene_collision.graph.update(
-                    frame_from=j.parent, frame_to=j.child, matrix=matrix
-                )
+        # update internal configuration vector - only consider actuated joints
+        if cfg_values is not None:
+            self._cfg[self._cfg_dof_indices] = np.asarray(
+                cfg_values, dtype=np.float64
+            ).reshape(-1)
+
+        idx, vals = [], []
+        for j, q in joint_cfg:
+            k = self._actuated_joint_name_to_index.get(j.name)
+            if k is not None:
+                dof_indices = self._actuated_dof_indices[k]
+                if len(dof_indices) == 1 and np.isscalar(q):
+                    idx.append(dof_indices[0])
+                    vals.append(q)
+                else:
+                    idx.extend(dof_indices)
+                    vals.extend(
+                        np.broadcast_to(
+                            np.asarray(q, dtype=np.float64).ravel(),
+                            (len(dof_indices),),
+                        ).tolist()
+                    )
+        if idx:
+            self._cfg[idx] = vals
+
+        matrices = self._forward_kinematics(self._joint_positions())
+
+        graphs = [
+            scene.graph
+            for scene in (self._scene, self._scene_collision)
+            if scene is not None
+        ]
+        for (parent, child), matrix in zip(self._fk_edges, matrices):
+            for graph in graphs:
+                graph.update(frame_from=parent, frame_to=child, matrix=matrix)
 
     def get_transform(self, frame_to, frame_from=None, collision_geometry=False):
         """Get the transform from one frame to another.
@@ -1186,6 +1996,85 @@ class URDF:
         self._collision_mesh = meshes[0] + meshes[1:]
         return self._collision_mesh
 
+    def _load_mesh_file(self, filename, force_mesh, skip_materials):
+        if force_mesh:
+            new_g = trimesh.load(
+                filename,
+                ignore_broken=True,
+                force="mesh",
+                skip_materials=skip_materials,
+            )
+
+            # add original filename
+            if "file_path" not in new_g.metadata:
+                new_g.metadata["file_path"] = os.path.abspath(filename)
+                new_g.metadata["file_name"] = os.path.basename(filename)
+
+            new_s = trimesh.Scene()
+            new_s.add_geometry(new_g)
+        else:
+            new_s = trimesh.load(
+                filename,
+                ignore_broken=True,
+                force="scene",
+                skip_materials=skip_materials,
+            )
+
+            if "file_path" in new_s.metadata:
+                for i, (_, geom) in enumerate(new_s.geometry.items()):
+                    if "file_path" not in geom.metadata:
+                        geom.metadata["file_path"] = new_s.metadata["file_path"]
+                        geom.metadata["file_name"] = new_s.metadata["file_name"]
+                        geom.metadata["file_element"] = i
+
+        return new_s
+
+    def _count_mesh_references(self, geometries, force_mesh, skip_materials):
+        """Count how often each mesh file is referenced by the geometries.
+
+        Args:
+            geometries (list[Visual] or list[Collision]): Geometries whose meshes will be loaded.
+            force_mesh (bool): Whether to concatenate each file into a single mesh.
+            skip_materials (bool): Whether to skip loading materials.
+
+        Returns:
+            dict[tuple, int]: Number of references per mesh cache key.
+        """
+        references = {}
+        for g in geometries:
+            if g.geometry is None or g.geometry.mesh is None:
+                continue
+
+            new_filename = self._filename_handler(g.geometry.mesh.filename)
+            cache_key = (new_filename, force_mesh, skip_materials)
+            references[cache_key] = references.get(cache_key, 0) + 1
+        return references
+
+    def _prefetch_mesh_files(self, cache_keys):
+        """Load mesh files in parallel and store them in the mesh cache. Threads only pay off
+        with multiple CPUs and more than a few files, otherwise files are loaded on first use.
+
+        Args:
+            cache_keys (list[tuple]): Mesh cache keys (filename, force_mesh, skip_materials) of the files.
+        """
+        if (os.cpu_count() or 1) <= 1 or len(cache_keys) <= _MIN_PREFETCH_FILES:
+            return
+
+        cache_keys = [
+            cache_key
+            for cache_key in cache_keys
+            if cache_key not in self._mesh_cache and os.path.isfile(cache_key[0])
+        ]
+        if len(cache_keys) == 0:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(8, len(cache_keys))) as executor:
+            new_scenes = executor.map(
+                lambda cache_key: self._load_mesh_file(*cache_key), cache_keys
+            )
+            for cache_key, new_s in zip(cache_keys, new_scenes):
+                self._mesh_cache[cache_key] = new_s
+
     def _geometry2trimeshscene(self, geometry, load_file, force_mesh, skip_materials):
         new_s = None
         if geometry.box is not None:
@@ -1197,53 +2086,46 @@ class URDF:
                 radius=geometry.cylinder.radius, height=geometry.cylinder.length
             ).scene()
         elif geometry.mesh is not None and load_file:
-            new_filename = self._filename_handler(fname=geometry.mesh.filename)
+            new_filename = self._filename_handler(geometry.mesh.filename)
 
-            if os.path.isfile(new_filename):
-                _logger.debug(f"Loading {geometry.mesh.filename} as {new_filename}")
+            cache_key = (new_filename, force_mesh, skip_materials)
 
-                if force_mesh:
-                    new_g = trimesh.load(
-                        new_filename,
-                        ignore_broken=True,
-                        force="mesh",
-                        skip_materials=skip_materials,
-                    )
+            # references to the same file that are still to come
+            remaining = self._mesh_references.pop(cache_key, 1) - 1
+            if remaining > 0:
+                self._mesh_references[cache_key] = remaining
 
-                    # add original filename
-                    if "file_path" not in new_g.metadata:
-                        new_g.metadata["file_path"] = os.path.abspath(new_filename)
-                        new_g.metadata["file_name"] = os.path.basename(new_filename)
+            if cache_key not in self._mesh_cache and os.path.isfile(new_filename):
+                _logger.debug(f"Loading {geometry.mesh.filename} as {new_filename}")
+                self._mesh_cache[cache_key] = self._load_mesh_file(*cache_key)
 
-                    new_s = trimesh.Scene()
-                    new_s.add_geometry(new_g)
+            if cache_key in self._mesh_cache:
+                # the returned scene gets modified,
+                # the last reference gets the cached one
+                if remaining > 0:
+                    new_s = self._mesh_cache[cache_key].copy()
                 else:
-                    new_s = trimesh.load(
-                        new_filename,
-                        ignore_broken=True,
-                        force="scene",
-                        skip_materials=skip_materials,
-                    )
-
-                    if "file_path" in new_s.metadata:
-                        for i, (_, geom) in enumerate(new_s.geometry.items()):
-                            if "file_path" not in geom.metadata:
-                                geom.metadata["file_path"] = new_s.metadata["file_path"]
-                                geom.metadata["file_name"] = new_s.metadata["file_name"]
-                                geom.metadata["file_element"] = i
-
-                # scale mesh appropriately
-                if geometry.mesh.scale is not None:
-                    if isinstance(geometry.mesh.scale, float):
-                        new_s = new_s.scaled(geometry.mesh.scale)
-                    elif isinstance(geometry.mesh.scale, np.ndarray):
-                        new_s = new_s.scaled(geometry.mesh.scale)
-                    else:
-                        _logger.warning(
-                            f"Warning: Can't interpret scale '{geometry.mesh.scale}'"
-                        )
+                    new_s = self._mesh_cache.pop(cache_key)
             else:
                 _logger.warning(f"Can't find {new_filename}")
+
+            # scale mesh appropriately
+            if new_s is not None and geometry.mesh.scale is not None:
+                scale = geometry.mesh.scale
+                if isinstance(scale, (float, np.ndarray)):
+                    nodes_geometry = new_s.graph.nodes_geometry
+                    if len(nodes_geometry) == 1 and np.array_equal(
+                        new_s.graph.get(nodes_geometry[0])[0], _EYE4
+                    ):
+                        # new_s isn't shared, its geometry can be scaled in place
+                        S = np.eye(4)
+                        S[:3, :3] *= scale
+                        for geom in new_s.geometry.values():
+                            geom.apply_transform(S)
+                    else:
+                        new_s = new_s.scaled(scale)
+                else:
+                    _logger.warning(f"Warning: Can't interpret scale '{scale}'")
         return new_s
 
     def _add_geometries_to_scene(
@@ -1273,41 +2155,29 @@ class URDF:
                     skip_materials=skip_materials,
                 )
                 if new_s is not None:
-                    origin = v.origin if v.origin is not None else np.eye(4)
-
-                    if force_single_geometry:
-                        for name in new_s.graph.nodes_geometry:
-                            T, geom_name = new_s.graph.get(name)
-                            geom = new_s.geometry[geom_name]
-
-                            if isinstance(v, Visual):
-                                apply_visual_color(geom, v, self._material_map)
-                            tmp_scene.add_geometry(
-                                geometry=geom,
-                                geom_name=v.name,
-                                parent_node_name=link_name,
-                                transform=origin @ T,
-                            )
-                    else:
-                        for name in new_s.graph.nodes_geometry:
-                            T, geom_name = new_s.graph.get(name)
-                            geom = new_s.geometry[geom_name]
-                            
-                            if isinstance(v, Visual):
-                                apply_visual_color(geom, v, self._material_map)
-                            s.add_geometry(
-                                geometry=geom,
-                                geom_name=v.name,
-                                parent_node_name=link_name,
-                                transform=origin @ T,
-                            )
+                    target_scene = tmp_scene if force_single_geometry else s
+
+                    for name in new_s.graph.nodes_geometry:
+                        T, geom_name = new_s.graph.get(name)
+                        geom = new_s.geometry[geom_name]
+
+                        if isinstance(v, Visual):
+                            apply_visual_color(geom, v, self._material_map)
+
+                        target_scene.add_geometry(
+                            geometry=geom,
+                            geom_name=v.name,
+                            parent_node_name=link_name,
+                            # a missing <origin> is the identity, no product needed
+                            transform=T if v.origin is None else v.origin @ T,
+                        )
 
         if force_single_geometry and len(tmp_scene.geometry) > 0:
             s.add_geometry(
                 geometry=tmp_scene.dump(concatenate=True),
                 geom_name=first_geom_name,
                 parent_node_name=link_name,
-                transform=np.eye(4),
+                transform=_EYE4,
             )
 
     def _create_scene(
@@ -1319,10 +2189,22 @@ class URDF:
     ):
         s = trimesh.scene.Scene(base_frame=self._base_link)
 
-        for j in self.robot.joints:
-            matrix, _ = self._forward_kinematics_joint(j)
+        matrices = self._forward_kinematics(self._joint_positions())
+        for (parent, child), matrix in zip(self._fk_edges, matrices):
+            s.graph.update(frame_from=parent, frame_to=child, matrix=matrix)
 
-            s.graph.update(frame_from=j.parent, frame_to=j.child, matrix=matrix)
+        if load_geometry:
+            geometries = [
+                g
+                for l in self.robot.links
+                for g in (l.collisions if use_collision_geometry else l.visuals)
+            ]
+            self._mesh_references = self._count_mesh_references(
+                geometries=geometries,
+                force_mesh=force_mesh,
+                skip_materials=use_collision_geometry,
+            )
+            self._prefetch_mesh_files(list(self._mesh_references))
 
         for l in self.robot.links:
             if l.name not in s.graph.nodes and l.name != s.graph.base_frame:
@@ -1355,24 +2237,30 @@ class URDF:
 
         Returns
         -----------
-        subnodes : set[str]
+        subnodes : frozenset[str]
           Set of nodes.
         """
-        # get every node that is a successor to specified node
-        # this includes `node`
-        return self._scene.graph.transforms.successors(node)
+        # the structure of the scene graph doesn't change after construction,
+        # update_cfg only changes the transforms
+        if node not in self._successors_cache:
+            # get every node that is a successor to specified node
+            # this includes `node`
+            self._successors_cache[node] = frozenset(
+                self._scene.graph.transforms.successors(node)
+            )
+        return self._successors_cache[node]
 
-    def _create_subrobot(self, robot_name, root_link_name):
+    def _create_subrobot(self, robot_name, root_link_name, excluded_nodes=frozenset()):
         subrobot = Robot(name=robot_name)
-        subnodes = self._successors(node=root_link_name)
+        subnodes = self._successors(node=root_link_name) - excluded_nodes
 
         if len(subnodes) > 0:
             for node in subnodes:
                 if node in self.link_map:
-                    subrobot.links.append(copy.deepcopy(self.link_map[node]))
+                    subrobot.links.append(_clone(self.link_map[node]))
             for joint_name, joint in self.joint_map.items():
                 if joint.parent in subnodes and joint.child in subnodes:
-                    subrobot.joints.append(copy.deepcopy(self.joint_map[joint_name]))
+                    subrobot.joints.append(_clone(self.joint_map[joint_name]))
 
         return subrobot
 
@@ -1387,48 +2275,69 @@ class URDF:
         Returns:
             list[(np.ndarray, yourdfpy.URDF)]: A list of tuples (np.ndarray, yourdfpy.URDF) whereas each homogeneous 4x4 matrix describes the root transformation of the respective URDF model w.r.t. the original URDF.
         """
-        root_urdf = URDF(
-            robot=copy.deepcopy(self.robot), build_scene_graph=False, load_meshes=False
-        )
+        root_robot = _clone(self.robot)
         result = []
 
+        # links and joints that are moved from the root robot to the new ones
+        removed_link_names = set()
+        removed_joint_names = set()
+
+        # first joint of the root robot that connects to each link
+        child_to_joint_name = {}
+        for j in root_robot.joints:
+            child_to_joint_name.setdefault(j.child, j.name)
+
         joint_types = joint_type if isinstance(joint_type, list) else [joint_type]
 
         # find all relevant joints
         joint_names = [j.name for j in self.robot.joints if j.type in joint_types]
-        for joint_name in joint_names:
+
+        # split nested joints first (a subtree is smaller than the one containing it),
+        # such that each split only gets the links not moved to a deeper one already
+        sub_urdfs = {}
+        for joint_name in sorted(
+            joint_names,
+            key=lambda name: len(self._successors(self.joint_map[name].child)),
+        ):
             root_link = self.link_map[self.joint_map[joint_name].child]
+            if root_link.name in removed_link_names:
+                continue
+
             new_robot = self._create_subrobot(
                 robot_name=root_link.name,
                 root_link_name=root_link.name,
+                excluded_nodes=removed_link_names,
             )
 
-            result.append(
-                (
-                    self._scene.graph.get(root_link.name)[0],
-                    URDF(robot=new_robot, **kwargs),
-                )
+            sub_urdfs[joint_name] = (
+                self._scene.graph.get(root_link.name)[0],
+                URDF(robot=new_robot, **kwargs),
             )
 
             # remove links and joints from root robot
-            for j in new_robot.joints:
-                root_urdf.robot.joints.remove(root_urdf.joint_map[j.name])
-            for l in new_robot.links:
-                root_urdf.robot.links.remove(root_urdf.link_map[l.name])
+            removed_joint_names.update(j.name for j in new_robot.joints)
+            removed_link_names.update(l.name for l in new_robot.links)
 
             # remove joint that connects root urdf to root_link
-            if root_link.name in [j.child for j in root_urdf.robot.joints]:
-                root_urdf.robot.joints.remove(
-                    root_urdf.robot.joints[
-                        [j.child for j in root_urdf.robot.joints].index(root_link.name)
-                    ]
-                )
+            if root_link.name in child_to_joint_name:
+                removed_joint_names.add(child_to_joint_name.pop(root_link.name))
+
+        root_robot.links = [
+            l for l in root_robot.links if l.name not in removed_link_names
+        ]
+        root_robot.joints = [
+            j for j in root_robot.joints if j.name not in removed_joint_names
+        ]
 
-        result.insert(0, (np.eye(4), URDF(robot=root_urdf.robot, **kwargs)))
+        result.append((np.eye(4), URDF(robot=root_robot, **kwargs)))
+        result.extend(sub_urdfs[name] for name in joint_names if name in sub_urdfs)
 
         return result
 
     def validate_filenames(self):
+        # each directory below mesh_dir is listed once, not every file checked
+        file_snapshot = _FileSnapshot(self._mesh_dir) if self._mesh_dir else None
+
         for l in self.robot.links:
             meshes = [
                 m.geometry.mesh
@@ -1436,8 +2345,9 @@ class URDF:
                 if m.geometry.mesh is not None
             ]
             for m in meshes:
-                _logger.debug(m.filename, "-->", self._filename_handler(m.filename))
-                if not os.path.isfile(self._filename_handler(m.filename)):
+                fname = self._filename_handler(m.filename)
+                _logger.debug(f"{m.filename} --> {fname}")
+                if not _file_exists(fname, file_snapshot=file_snapshot):
                     return False
         return True
 
@@ -1465,8 +2375,20 @@ class URDF:
         Args:
             fname (str): Filename of the file to be written. Usually ends in `.urdf`.
         """
-        xml_element = self.write_xml()
-        xml_element.write(fname, xml_declaration=True, pretty_print=True)
+        # Stream one link/joint/material subtree at a time instead of holding
+        # the whole element tree in memory.
+        scratch = etree.Element("robot")
+        with etree.xmlfile(fname, encoding="utf-8") as xf:
+            xf.write_declaration()
+            with xf.element("robot", attrib={"name": self.robot.name}):
+                for write, item in self._robot_writers(self.robot):
+                    # writers append no element for None, e.g., materials
+                    write(scratch, item)
+                    for xml_element in scratch:
+                        etree.indent(xml_element, level=1)
+                        xf.write("\n  ", xml_element)
+                    scratch.clear()
+                xf.write("\n")
 
     def _parse_mimic(xml_element):
         if xml_element is None:
@@ -1623,13 +2545,11 @@ class URDF:
 
     def _parse_box(xml_element):
         # In case the element uses comma as a separator
-        size = xml_element.attrib["size"].replace(',', ' ').split()
-        return Box(size=np.array(size, dtype=np.float64))
+        size = xml_element.attrib["size"].replace(",", " ")
+        return Box(size=_str2vec(size))
 
     def _write_box(self, xml_parent, box):
-        etree.SubElement(
-            xml_parent, "box", attrib={"size": " ".join(map(str, box.size))}
-        )
+        etree.SubElement(xml_parent, "box", attrib={"size": _vec2str(box.size)})
 
     def _parse_cylinder(xml_element):
         return Cylinder(
@@ -1659,7 +2579,7 @@ class URDF:
             elif len(s) == 1:
                 return float(s[0])
             else:
-                return np.array(list(map(float, s)))
+                return np.array(s, dtype=np.float64)
         return None
 
     def _write_scale(self, xml_parent, scale):
@@ -1667,7 +2587,7 @@ class URDF:
             if isinstance(scale, float) or isinstance(scale, int):
                 xml_parent.set("scale", " ".join([str(scale)] * 3))
             else:
-                xml_parent.set("scale", " ".join(map(str, scale)))
+                xml_parent.set("scale", _vec2str(scale))
 
     def _parse_mesh(xml_element):
         return Mesh(
@@ -1686,16 +2606,12 @@ class URDF:
 
     def _parse_geometry(xml_element):
         geometry = Geometry()
-        if xml_element[0].tag == "box":
-            geometry.box = URDF._parse_box(xml_element[0])
-        elif xml_element[0].tag == "cylinder":
-            geometry.cylinder = URDF._parse_cylinder(xml_element[0])
-        elif xml_element[0].tag == "sphere":
-            geometry.sphere = URDF._parse_sphere(xml_element[0])
-        elif xml_element[0].tag == "mesh":
-            geometry.mesh = URDF._parse_mesh(xml_element[0])
-        else:
-            raise ValueError(f"Unknown tag: {xml_element[0].tag}")
+        tag = xml_element[0].tag
+        if tag not in _GEOMETRY_PARSERS:
+            raise ValueError(f"Unknown tag: {tag}")
+
+        # the attributes of Geometry are named after the tags
+        setattr(geometry, tag, _GEOMETRY_PARSERS[tag](xml_element[0]))
 
         return geometry
 
@@ -1748,22 +2664,17 @@ class URDF:
         xyz = xml_element.get("xyz", default="0 0 0")
         rpy = xml_element.get("rpy", default="0 0 0")
 
-        return tra.compose_matrix(
-            translate=np.array(list(map(float, xyz.split()))),
-            angles=np.array(list(map(float, rpy.split()))),
-        )
+        return _compose_xyz_rpy(_str2vec(xyz), _str2vec(rpy))
 
     def _write_origin(self, xml_parent, origin):
         if origin is None:
             return
 
+        xyz, rpy = _xyz_rpy_from_matrix(origin)
         etree.SubElement(
             xml_parent,
             "origin",
-            attrib={
-                "xyz": " ".join(map(str, tra.translation_from_matrix(origin))),
-                "rpy": " ".join(map(str, tra.euler_from_matrix(origin))),
-            },
+            attrib={"xyz": _vec2str(xyz), "rpy": _vec2str(rpy)},
         )
 
     def _parse_color(xml_element):
@@ -1772,15 +2683,13 @@ class URDF:
 
         rgba = xml_element.get("rgba", default="1 1 1 1")
 
-        return Color(rgba=np.array(list(map(float, rgba.split()))))
+        return Color(rgba=_str2vec(rgba))
 
     def _write_color(self, xml_parent, color):
         if color is None:
             return
 
-        etree.SubElement(
-            xml_parent, "color", attrib={"rgba": " ".join(map(str, color.rgba))}
-        )
+        etree.SubElement(xml_parent, "color", attrib={"rgba": _vec2str(color.rgba)})
 
     def _parse_texture(xml_element):
         if xml_element is None:
@@ -1801,8 +2710,8 @@ class URDF:
             return None
 
         material = Material(name=xml_element.get("name"))
-        material.color = URDF._parse_color(xml_element.find("color"))
-        material.texture = URDF._parse_texture(xml_element.find("texture"))
+        for attr, value in _parse_children(xml_element, _MATERIAL_CHILD_PARSERS):
+            setattr(material, attr, value)
 
         return material
 
@@ -1823,9 +2732,8 @@ class URDF:
     def _parse_visual(xml_element):
         visual = Visual(name=xml_element.get("name"))
 
-        visual.geometry = URDF._parse_geometry(xml_element.find("geometry"))
-        visual.origin = URDF._parse_origin(xml_element.find("origin"))
-        visual.material = URDF._parse_material(xml_element.find("material"))
+        for attr, value in _parse_children(xml_element, _VISUAL_CHILD_PARSERS):
+            setattr(visual, attr, value)
 
         return visual
 
@@ -1847,8 +2755,8 @@ class URDF:
     def _parse_collision(xml_element):
         collision = Collision(name=xml_element.get("name"))
 
-        collision.geometry = URDF._parse_geometry(xml_element.find("geometry"))
-        collision.origin = URDF._parse_origin(xml_element.find("origin"))
+        for attr, value in _parse_children(xml_element, _COLLISION_CHILD_PARSERS):
+            setattr(collision, attr, value)
 
         return collision
 
@@ -1872,41 +2780,34 @@ class URDF:
 
         x = xml_element
 
+        # convert each of the six distinct entries once and mirror them
         return np.array(
             [
-                [
-                    x.get("ixx", default=1.0),
-                    x.get("ixy", default=0.0),
-                    x.get("ixz", default=0.0),
-                ],
-                [
-                    x.get("ixy", default=0.0),
-                    x.get("iyy", default=1.0),
-                    x.get("iyz", default=0.0),
-                ],
-                [
-                    x.get("ixz", default=0.0),
-                    x.get("iyz", default=0.0),
-                    x.get("izz", default=1.0),
-                ],
+                x.get("ixx", default=1.0),
+                x.get("ixy", default=0.0),
+                x.get("ixz", default=0.0),
+                x.get("iyy", default=1.0),
+                x.get("iyz", default=0.0),
+                x.get("izz", default=1.0),
             ],
             dtype=np.float64,
-        )
+        )[_INERTIA_INDICES]
 
     def _write_inertia(self, xml_parent, inertia):
         if inertia is None:
             return None
 
+        I = np.asarray(inertia).tolist()
         etree.SubElement(
             xml_parent,
             "inertia",
             attrib={
-                "ixx": str(inertia[0, 0]),
-                "ixy": str(inertia[0, 1]),
-                "ixz": str(inertia[0, 2]),
-                "iyy": str(inertia[1, 1]),
-                "iyz": str(inertia[1, 2]),
-                "izz": str(inertia[2, 2]),
+                "ixx": str(I[0][0]),
+                "ixy": str(I[0][1]),
+                "ixz": str(I[0][2]),
+                "iyy": str(I[1][1]),
+                "iyz": str(I[1][2]),
+                "izz": str(I[2][2]),
             },
         )
 
@@ -1933,9 +2834,8 @@ class URDF:
             return None
 
         inertial = Inertial()
-        inertial.origin = URDF._parse_origin(xml_element.find("origin"))
-        inertial.inertia = URDF._parse_inertia(xml_element.find("inertia"))
-        inertial.mass = URDF._parse_mass(xml_element.find("mass"))
+        for attr, value in _parse_children(xml_element, _INERTIAL_CHILD_PARSERS):
+            setattr(inertial, attr, value)
 
         return inertial
 
@@ -1952,13 +2852,16 @@ class URDF:
     def _parse_link(xml_element):
         link = Link(name=xml_element.attrib["name"])
 
-        link.inertial = URDF._parse_inertial(xml_element.find("inertial"))
-
-        for v in xml_element.findall("visual"):
-            link.visuals.append(URDF._parse_visual(v))
-
-        for c in xml_element.findall("collision"):
-            link.collisions.append(URDF._parse_collision(c))
+        # single pass over the children, only the first <inertial> counts
+        xml_inertial = None
+        for child in xml_element:
+            if child.tag == "visual":
+                link.visuals.append(URDF._parse_visual(child))
+            elif child.tag == "collision":
+                link.collisions.append(URDF._parse_collision(child))
+            elif child.tag == "inertial" and xml_inertial is None:
+                xml_inertial = child
+        link.inertial = URDF._parse_inertial(xml_inertial)
 
         return link
 
@@ -1990,16 +2893,16 @@ class URDF:
 
     def _parse_axis(xml_element):
         if xml_element is None:
-            return np.array([1.0, 0, 0])
+            return _DEFAULT_AXIS.copy()
 
         xyz = xml_element.get("xyz", "1 0 0")
-        return np.array(list(map(float, xyz.split())))
+        return _str2vec(xyz)
 
     def _write_axis(self, xml_parent, axis):
         if axis is None:
             return
 
-        etree.SubElement(xml_parent, "axis", attrib={"xyz": " ".join(map(str, axis))})
+        etree.SubElement(xml_parent, "axis", attrib={"xyz": _vec2str(axis)})
 
     def _parse_limit(xml_element):
         if xml_element is None:
@@ -2090,17 +2993,8 @@ class URDF:
         joint = Joint(name=xml_element.attrib["name"])
 
         joint.type = xml_element.get("type", default=None)
-        joint.parent = xml_element.find("parent").get("link")
-        joint.child = xml_element.find("child").get("link")
-        joint.origin = URDF._parse_origin(xml_element.find("origin"))
-        joint.axis = URDF._parse_axis(xml_element.find("axis"))
-        joint.limit = URDF._parse_limit(xml_element.find("limit"))
-        joint.dynamics = URDF._parse_dynamics(xml_element.find("dynamics"))
-        joint.mimic = URDF._parse_mimic(xml_element.find("mimic"))
-        joint.calibration = URDF._parse_calibration(xml_element.find("calibration"))
-        joint.safety_controller = URDF._parse_safety_controller(
-            xml_element.find("safety_controller")
-        )
+        for attr, value in _parse_children(xml_element, _JOINT_CHILD_PARSERS):
+            setattr(joint, attr, value)
 
         return joint
 
@@ -2158,14 +3052,118 @@ class URDF:
     def _parse_robot(xml_element):
         robot = Robot(name=xml_element.attrib["name"])
 
-        for l in xml_element.findall("link"):
-            robot.links.append(URDF._parse_link(l))
-        for j in xml_element.findall("joint"):
-            robot.joints.append(URDF._parse_joint(j))
-        for m in xml_element.findall("material"):
-            robot.materials.append(URDF._parse_material(m))
+        for child in xml_element:
+            if child.tag == "link":
+                robot.links.append(URDF._parse_link(child))
+            elif child.tag == "joint":
+                robot.joints.append(URDF._parse_joint(child))
+            elif child.tag == "material":
+                robot.materials.append(URDF._parse_material(child))
         return robot
 
+    @staticmethod
+    def _parse_robot_stream(fname_or_file, chunk_size=65536, recover=False):
+        """Parse a URDF in a single streaming pass. Each top-level element is turned into its
+        dataclass as soon as it is complete and subsequently freed, i.e., the XML tree is never fully materialized.
+
+        Args:
+            fname_or_file (str, os.PathLike or file object): A filename or file object, file-like object, stream representing the URDF file.
+            chunk_size (int, optional): Number of bytes or characters read at once. Defaults to 65536.
+            recover (bool, optional): Whether to recover from malformed XML. Elements with an (undeclared) namespace prefix, e.g., xacro macros, are ignored. Defaults to False.
+
+        Raises:
+            etree.XMLSyntaxError: If the XML is malformed.
+
+        Returns:
+            Robot: The robot model.
+        """
+        if isinstance(fname_or_file, six.string_types + (os.PathLike,)):
+            with open(fname_or_file, "rb") as f:
+                return URDF._parse_robot_stream(
+                    f, chunk_size=chunk_size, recover=recover
+                )
+
+        links, joints, materials = [], [], []
+        parsers = {
+            "link": (links, URDF._parse_link),
+            "joint": (joints, URDF._parse_joint),
+            "material": (materials, URDF._parse_material),
+        }
+
+        parser = etree.XMLPullParser(
+            events=("end",),
+            # when recovering, all elements are needed to drop the namespaced ones
+            tag=None if recover else tuple(parsers),
+            remove_blank_text=True,
+            remove_comments=True,
+            remove_pis=recover,
+            recover=recover,
+        )
+
+        def _parse_events():
+            for _, xml_element in parser.read_events():
+                xml_parent = xml_element.getparent()
+                if recover and ":" in xml_element.tag and xml_parent is not None:
+                    # children end before their parent, i.e., before it is parsed
+                    xml_parent.remove(xml_element)
+                    continue
+                if xml_element.tag not in parsers:
+                    continue
+                if xml_parent is None or xml_parent.getparent() is not None:
+                    # not a child of <robot>, e.g., the <material> of a <visual>
+                    continue
+
+                elements, parse_fn = parsers[xml_element.tag]
+                elements.append(parse_fn(xml_element))
+
+                # free everything that has been parsed so far
+                xml_element.clear()
+                while xml_element.getprevious() is not None:
+                    del xml_parent[0]
+
+        chunk = fname_or_file.read(chunk_size)
+        while chunk:
+            parser.feed(chunk)
+            _parse_events()
+            chunk = fname_or_file.read(chunk_size)
+        xml_root = parser.close()
+        _parse_events()
+
+        return Robot(
+            name=xml_root.attrib["name"],
+            links=links,
+            joints=joints,
+            materials=materials,
+        )
+
+    @staticmethod
+    def _parse_robot_target(fname_or_file, chunk_size=65536):
+        """Parse a URDF with an lxml target parser, see _URDFTarget.
+
+        Args:
+            fname_or_file (str or file object): A filename or file object, file-like object, stream representing the URDF file.
+            chunk_size (int, optional): Number of bytes or characters read at once. Defaults to 65536.
+
+        Raises:
+            etree.XMLSyntaxError: If the XML is malformed.
+
+        Returns:
+            Robot: The robot model.
+        """
+        if isinstance(fname_or_file, six.string_types + (os.PathLike,)):
+            with open(fname_or_file, "rb") as f:
+                return URDF._parse_robot_target(f, chunk_size=chunk_size)
+
+        parser = etree.XMLParser(
+            target=_URDFTarget(), remove_blank_text=True, remove_comments=True
+        )
+        # feeding, unlike etree.parse, accepts text streams with an encoding declaration
+        chunk = fname_or_file.read(chunk_size)
+        while chunk:
+            parser.feed(chunk)
+            chunk = fname_or_file.read(chunk_size)
+        return parser.close()
+
     def _validate_robot(self, robot):
         if robot is not None:
             self._validate_required_attribute(
@@ -2179,14 +3177,26 @@ class URDF:
             for j in robot.joints:
                 self._validate_joint(j)
 
-    def _write_robot(self, robot):
-        xml_element = etree.Element("robot", attrib={"name": robot.name})
+    def _robot_writers(self, robot):
+        """Yield the top-level elements of a robot in the order they are written.
+
+        Args:
+            robot (yourdfpy.Robot): The robot model.
+
+        Yields:
+            tuple[Callable, Any]: A write function taking (xml_parent, item) and the item, i.e., a link, joint, or material.
+        """
         for link in robot.links:
-            self._write_link(xml_element, link)
+            yield self._write_link, link
         for joint in robot.joints:
-            self._write_joint(xml_element, joint)
+            yield self._write_joint, joint
         for material in robot.materials:
-            self._write_material(xml_element, material)
+            yield self._write_material, material
+
+    def _write_robot(self, robot):
+        xml_element = etree.Element("robot", attrib={"name": robot.name})
+        for write, item in self._robot_writers(robot):
+            write(xml_element, item)
 
         return xml_element
 
@@ -2194,3 +3204,62 @@ class URDF:
         if not isinstance(other, URDF):
             raise NotImplemented
         return self.robot == other.robot
+
+
+def _parse_children(xml_element, child_parsers):
+    """Parse the children of an XML element in a single pass.
+
+    Args:
+        xml_element (etree.Element): The XML element.
+        child_parsers (dict): A mapping from tag to (attribute name, parse function). Only the first child with a given tag is parsed.
+
+    Returns:
+        list[tuple[str, Any]]: Attribute names and values, the parse function is called with None for missing tags.
+    """
+    values = {}
+    for child in xml_element:
+        entry = child_parsers.get(child.tag)
+        if entry is not None and entry[0] not in values:
+            values[entry[0]] = entry[1](child)
+
+    return [
+        (attr, values[attr] if attr in values else parse_fn(None))
+        for attr, parse_fn in child_parsers.values()
+    ]
+
+
+_GEOMETRY_PARSERS = {
+    "box": URDF._parse_box,
+    "cylinder": URDF._parse_cylinder,
+    "sphere": URDF._parse_sphere,
+    "mesh": URDF._parse_mesh,
+}
+_MATERIAL_CHILD_PARSERS = {
+    "color": ("color", URDF._parse_color),
+    "texture": ("texture", URDF._parse_texture),
+}
+_VISUAL_CHILD_PARSERS = {
+    "geometry": ("geometry", URDF._parse_geometry),
+    "origin": ("origin", URDF._parse_origin),
+    "material": ("material", URDF._parse_material),
+}
+_COLLISION_CHILD_PARSERS = {
+    "geometry": ("geometry", URDF._parse_geometry),
+    "origin": ("origin", URDF._parse_origin),
+}
+_INERTIAL_CHILD_PARSERS = {
+    "origin": ("origin", URDF._parse_origin),
+    "inertia": ("inertia", URDF._parse_inertia),
+    "mass": ("mass", URDF._parse_mass),
+}
+_JOINT_CHILD_PARSERS = {
+    "parent": ("parent", lambda x: x.get("link")),
+    "child": ("child", lambda x: x.get("link")),
+    "origin": ("origin", URDF._parse_origin),
+    "axis": ("axis", URDF._parse_axis),
+    "limit": ("limit", URDF._parse_limit),
+    "dynamics": ("dynamics", URDF._parse_dynamics),
+    "mimic": ("mimic", URDF._parse_mimic),
+    "calibration": ("calibration", URDF._parse_calibration),
+    "safety_controller": ("safety_controller", URDF._parse_safety_controller),
+}
@@ -1,6 +1,12 @@
 import pytest
 import os
 import io
+import pathlib
+import copy
+import numpy as np
+import trimesh
+import trimesh.transformations as tra
+from lxml import etree
 
 from yourdfpy import urdf
 
@@ -156,3 +162,682 @@ def test_geometric_primitives():
         )
         assert urdf_model.link_map["link_0"].visuals[2].geometry.cylinder.radius == 11
         assert urdf_model.link_map["link_0"].visuals[2].geometry.cylinder.length == 4
+
+
+def test_geometry_origin():
+    urdf_str = """
+    <robot name="geometry_origin_test">
+        <link name="link_0">
+            <visual name="visual_0">
+                <geometry>
+                    <box size="1 2 3" />
+                </geometry>
+            </visual>
+            <visual name="visual_1">
+                <origin xyz="1 2 3" rpy="0 0 1.5707963" />
+                <geometry>
+                    <box size="1 2 3" />
+                </geometry>
+            </visual>
+        </link>
+    </robot>
+    """
+    with io.StringIO(urdf_str) as f:
+        urdf_model = urdf.URDF.load(f)
+
+    assert np.allclose(urdf_model.scene.graph.get("visual_0", "link_0")[0], np.eye(4))
+    assert np.allclose(
+        urdf_model.scene.graph.get("visual_1", "link_0")[0],
+        urdf_model.link_map["link_0"].visuals[1].origin,
+    )
+
+
+@pytest.mark.parametrize("use_kernel", [True, False])
+def test_forward_kinematics(monkeypatch, use_kernel):
+    # without numba, the kernel is tested as plain Python loop
+    kernel = (urdf._fk_kernel or urdf._fk_loop) if use_kernel else None
+    kernel_calls = []
+
+    def fk_kernel(*args):
+        kernel_calls.append(args)
+        return kernel(*args)
+
+    monkeypatch.setattr(urdf, "_fk_kernel", fk_kernel if use_kernel else None)
+
+    urdf_str = """
+    <robot name="fk_test">
+        <link name="link_0" />
+        <link name="link_1" />
+        <link name="link_2" />
+        <link name="link_3" />
+        <joint name="joint_0" type="revolute">
+            <parent link="link_0" />
+            <child link="link_1" />
+            <origin xyz="0 0 1" rpy="0 0 0" />
+            <axis xyz="0 0 1" />
+            <limit lower="-3.14" upper="3.14" effort="1" velocity="1" />
+        </joint>
+        <joint name="joint_1" type="prismatic">
+            <parent link="link_1" />
+            <child link="link_2" />
+            <origin xyz="1 0 0" rpy="0 0 0" />
+            <axis xyz="1 0 0" />
+            <limit lower="0" upper="1" effort="1" velocity="1" />
+        </joint>
+        <joint name="joint_2" type="continuous">
+            <parent link="link_2" />
+            <child link="link_3" />
+            <axis xyz="1 0 0" />
+        </joint>
+    </robot>
+    """
+    with io.StringIO(urdf_str) as f:
+        urdf_model = urdf.URDF.load(f)
+
+    kernel_calls.clear()
+    urdf_model.update_cfg([np.pi / 2.0, 0.5, np.pi])
+
+    assert bool(kernel_calls) == use_kernel
+    assert np.allclose(urdf_model.cfg, [np.pi / 2.0, 0.5, np.pi])
+    assert np.allclose(
+        urdf_model.get_transform("link_1"),
+        tra.translation_matrix([0, 0, 1]) @ tra.rotation_matrix(np.pi / 2.0, [0, 0, 1]),
+    )
+    assert np.allclose(
+        urdf_model.get_transform("link_2")[:3, 3],
+        [0, 1.5, 1],
+    )
+    assert np.allclose(
+        urdf_model.get_transform(frame_to="link_3", frame_from="link_2"),
+        tra.rotation_matrix(np.pi, [1, 0, 0]),
+    )
+
+
+def test_repeated_mesh(tmp_path):
+    trimesh.creation.box(extents=[1, 1, 1]).export(str(tmp_path / "box.stl"))
+    urdf_str = """
+    <robot name="repeated_mesh_test">
+        <link name="link_0">
+            <visual name="visual_0">
+                <geometry>
+                    <mesh filename="package://test/box.stl" />
+                </geometry>
+            </visual>
+        </link>
+        <link name="link_1">
+            <visual name="visual_1">
+                <geometry>
+                    <mesh filename="package://test/box.stl" scale="2 2 2" />
+                </geometry>
+            </visual>
+        </link>
+        <link name="link_2">
+            <visual name="visual_2">
+                <geometry>
+                    <mesh filename="package://test/box.stl" scale="1 2 3" />
+                </geometry>
+            </visual>
+        </link>
+        <joint name="joint_0" type="fixed">
+            <parent link="link_0" />
+            <child link="link_1" />
+        </joint>
+        <joint name="joint_1" type="fixed">
+            <parent link="link_1" />
+            <child link="link_2" />
+        </joint>
+    </robot>
+    """
+    urdf_fname = tmp_path / "repeated_mesh.urdf"
+    urdf_fname.write_text(urdf_str)
+
+    urdf_model = urdf.URDF.load(str(urdf_fname))
+
+    geoms = list(urdf_model.scene.geometry.values())
+    assert len(geoms) == 3
+    assert geoms[0] is not geoms[1]
+    assert geoms[1] is not geoms[2]
+    assert np.allclose(geoms[0].extents, [1, 1, 1])
+    assert np.allclose(geoms[1].extents, [2, 2, 2])
+    assert np.allclose(geoms[2].extents, [1, 2, 3])
+
+
+@pytest.mark.parametrize("cpu_count", [1, 4])
+def test_prefetch_mesh_files(tmp_path, monkeypatch, cpu_count):
+    monkeypatch.setattr(urdf.os, "cpu_count", lambda: cpu_count)
+    links = []
+    for i in range(6):
+        trimesh.creation.box(extents=[1, 1, i + 1]).export(str(tmp_path / f"{i}.stl"))
+        links.append(
+            f"""
+        <link name="link_{i}">
+            <visual name="visual_{i}">
+                <geometry>
+                    <mesh filename="{i}.stl" />
+                </geometry>
+            </visual>
+        </link>"""
+        )
+    urdf_fname = tmp_path / "prefetch_mesh_files.urdf"
+    urdf_fname.write_text(
+        '<robot name="prefetch_mesh_files_test">{}</robot>'.format("".join(links))
+    )
+
+    urdf_model = urdf.URDF.load(str(urdf_fname))
+
+    extents = [g.extents for g in urdf_model.scene.geometry.values()]
+    assert np.allclose(extents, [[1, 1, i + 1] for i in range(6)])
+    assert urdf_model._mesh_cache == {}
+
+
+def test_parse_robot_stream():
+    urdf_fname = os.path.join(DIR_MODELS, "franka", "franka.urdf")
+
+    robot_dom = urdf.URDF._parse_robot(etree.parse(urdf_fname).getroot())
+    robot_stream = urdf.URDF._parse_robot_stream(urdf_fname, chunk_size=128)
+
+    assert robot_dom == robot_stream
+    assert [l.name for l in robot_dom.links] == [l.name for l in robot_stream.links]
+
+
+@pytest.mark.parametrize("as_stream", [False, True])
+def test_parse_robot_target(as_stream):
+    urdf_fname = os.path.join(DIR_MODELS, "franka", "franka.urdf")
+
+    robot_dom = urdf.URDF._parse_robot(etree.parse(urdf_fname).getroot())
+    if as_stream:
+        with open(urdf_fname) as f:
+            robot_target = urdf.URDF._parse_robot_target(io.StringIO(f.read()))
+    else:
+        robot_target = urdf.URDF._parse_robot_target(urdf_fname)
+
+    assert robot_dom == robot_target
+    assert [j.name for j in robot_dom.joints] == [j.name for j in robot_target.joints]
+
+
+def test_load_malformed_urdf():
+    urdf_str = """
+    <robot name="malformed">
+        <link name="link_0">
+            <visual>
+                <xacro:insert_block name="origin" />
+                <geometry>
+                    <box size="1 1 1" />
+                </geometry>
+            </visual>
+        </link>
+        <xacro:unknown name="broken" />
+        <link name="link_1" />
+    </robot>
+    """
+    for fast in [False, True]:
+        for f in [io.BytesIO(urdf_str.encode()), io.StringIO(urdf_str)]:
+            with f:
+                urdf_model = urdf.URDF.load(f, fast=fast)
+
+            assert list(urdf_model.link_map) == ["link_0", "link_1"]
+            assert urdf_model.link_map["link_0"].visuals[0].geometry.box is not None
+
+
+def test_load_encoding_declaration():
+    urdf_str = """<?xml version="1.0" encoding="utf-8"?>
+    <robot name="encoding_declaration">
+        <link name="link_0" />
+        <link name="link_1" />
+    </robot>
+    """
+    for fast in [False, True]:
+        for f in [io.BytesIO(urdf_str.encode()), io.StringIO(urdf_str)]:
+            with f:
+                urdf_model = urdf.URDF.load(f, fast=fast)
+
+            assert urdf_model.robot.name == "encoding_declaration"
+            assert list(urdf_model.link_map) == ["link_0", "link_1"]
+
+
+def test_load_construction_error(caplog):
+    urdf_str = """
+    <robot name="construction_error">
+        <link name="link_0">
+            <visual>
+                <geometry>
+                    <mesh filename="box.stl" />
+                </geometry>
+            </visual>
+        </link>
+    </robot>
+    """
+
+    def filename_handler(fname):
+        raise etree.XMLSyntaxError("handler error", None, 1, 1)
+
+    # errors outside of parsing don't trigger the recovering parser
+    with io.StringIO(urdf_str) as f:
+        with pytest.raises(etree.XMLSyntaxError, match="handler error"):
+            urdf.URDF.load(f, filename_handler=filename_handler)
+    assert "Using different parsing approach." not in caplog.text
+
+
+def test_load_pathlike():
+    urdf_fname = os.path.join(DIR_MODELS, "franka", "franka.urdf")
+    urdf_model = urdf.URDF.load(urdf_fname, build_scene_graph=False, load_meshes=False)
+
+    for fast in [False, True]:
+        urdf_model_path = urdf.URDF.load(
+            pathlib.Path(urdf_fname),
+            build_scene_graph=False,
+            load_meshes=False,
+            fast=fast,
+        )
+        assert urdf_model_path == urdf_model
+    assert urdf.URDF._parse_robot_stream(pathlib.Path(urdf_fname)) == urdf_model.robot
+
+    with pytest.raises(ValueError):
+        urdf.URDF.load(pathlib.Path(DIR_MODELS) / "missing.urdf")
+
+
+def test_slots():
+    joint = urdf.Joint(name="joint_0", limit=urdf.Limit(lower=-1.0, upper=1.0))
+
+    assert not hasattr(joint, "__dict__")
+    assert not hasattr(joint.limit, "__dict__")
+    assert copy.deepcopy(joint) == joint
+    with pytest.raises(AttributeError):
+        joint.unknown_attribute = 1.0
+
+
+def test_clone():
+    robot = urdf.URDF._parse_robot_stream(
+        os.path.join(DIR_MODELS, "franka", "franka.urdf")
+    )
+
+    robot_clone = urdf._clone(robot)
+
+    assert robot_clone == robot == copy.deepcopy(robot)
+    assert robot_clone.links[1] is not robot.links[1]
+    assert robot_clone.joints[0].origin is not robot.joints[0].origin
+
+    robot_clone.joints[0].origin[0, 3] += 1.0
+    assert robot_clone != robot
+
+
+def test_contains():
+    urdf_fname = os.path.join(DIR_MODELS, "franka", "franka.urdf")
+    urdf_model = urdf.URDF.load(urdf_fname, build_scene_graph=False, load_meshes=False)
+
+    assert urdf_model.contains("name", "panda_joint3")
+    assert urdf_model.contains("joint", "panda_finger_joint1")
+    assert not urdf_model.contains("name", "panda_joint42")
+    assert urdf_model.contains(
+        "name", "panda_link0", element=urdf_model.link_map["panda_link0"]
+    )
+    assert not urdf_model.contains(
+        "name", "panda_link1", element=urdf_model.link_map["panda_link0"]
+    )
+
+
+def test_mimic_joint_forward_kinematics():
+    urdf_str = """
+    <robot name="mimic_test">
+        <link name="link_0" />
+        <link name="link_1" />
+        <link name="link_2" />
+        <link name="link_3" />
+        <joint name="joint_0" type="prismatic">
+            <parent link="link_0" />
+            <child link="link_1" />
+            <axis xyz="1 0 0" />
+            <limit lower="0" upper="1" effort="1" velocity="1" />
+        </joint>
+        <joint name="joint_1" type="prismatic">
+            <parent link="link_0" />
+            <child link="link_2" />
+            <axis xyz="0 1 0" />
+            <limit lower="0" upper="1" effort="1" velocity="1" />
+            <mimic joint="joint_0" multiplier="2.0" offset="0.1" />
+        </joint>
+        <joint name="joint_2" type="prismatic">
+            <parent link="link_0" />
+            <child link="link_3" />
+            <axis xyz="0 0 1" />
+            <limit lower="0" upper="1" effort="1" velocity="1" />
+            <mimic joint="joint_1" offset="0.3" />
+        </joint>
+    </robot>
+    """
+    with io.StringIO(urdf_str) as f:
+        urdf_model = urdf.URDF.load(f)
+
+    assert list(urdf_model.actuated_joint_names) == ["joint_0"]
+
+    urdf_model.update_cfg({"joint_0": 0.25})
+
+    assert np.allclose(urdf_model.get_transform("link_1")[:3, 3], [0.25, 0, 0])
+    assert np.allclose(urdf_model.get_transform("link_2")[:3, 3], [0, 0.6, 0])
+    # mimics a joint that is not actuated
+    assert np.allclose(urdf_model.get_transform("link_3")[:3, 3], [0, 0, 0.3])
+
+
+def test_center_cfg():
+    urdf_str = """
+    <robot name="center_cfg_test">
+        <link name="link_0" />
+        <link name="link_1" />
+        <link name="link_2" />
+        <link name="link_3" />
+        <link name="link_4" />
+        <joint name="joint_0" type="planar">
+            <parent link="link_0" />
+            <child link="link_1" />
+        </joint>
+        <joint name="joint_1" type="revolute">
+            <parent link="link_1" />
+            <child link="link_2" />
+            <limit lower="-1" upper="2" effort="1" velocity="1" />
+        </joint>
+        <joint name="joint_2" type="prismatic">
+            <parent link="link_2" />
+            <child link="link_3" />
+            <limit lower="0" upper="1" effort="1" velocity="1" />
+            <mimic joint="joint_1" multiplier="2.0" />
+        </joint>
+        <joint name="joint_3" type="continuous">
+            <parent link="link_3" />
+            <child link="link_4" />
+        </joint>
+    </robot>
+    """
+    with io.StringIO(urdf_str) as f:
+        urdf_model = urdf.URDF.load(f)
+
+    assert urdf_model.num_dofs == 4
+    assert np.allclose(urdf_model.zero_cfg, np.zeros(4))
+    assert np.allclose(urdf_model.center_cfg, [0.0, 0.0, 0.5, 0.0])
+
+
+def test_center_cfg_missing_limits():
+    urdf_str = """
+    <robot name="center_cfg_missing_limits_test">
+        <link name="link_0" />
+        <link name="link_1" />
+        <link name="link_2" />
+        <joint name="joint_0" type="revolute">
+            <parent link="link_0" />
+            <child link="link_1" />
+            <limit effort="1" velocity="1" />
+        </joint>
+        <joint name="joint_1" type="prismatic">
+            <parent link="link_1" />
+            <child link="link_2" />
+            <limit upper="2" effort="1" velocity="1" />
+        </joint>
+    </robot>
+    """
+    with io.StringIO(urdf_str) as f:
+        urdf_model = urdf.URDF.load(f)
+
+    assert np.array_equal(urdf_model.center_cfg, [0.0, 1.0])
+
+    urdf_model.update_cfg(urdf_model.center_cfg)
+    assert np.isfinite(urdf_model.get_transform("link_2", "link_0")).all()
+
+
+def test_update_cfg_dict():
+    urdf_str = """
+    <robot name="update_cfg_dict_test">
+        <link name="link_0" />
+        <link name="link_1" />
+        <link name="link_2" />
+        <link name="link_3" />
+        <joint name="joint_0" type="planar">
+            <parent link="link_0" />
+            <child link="link_1" />
+        </joint>
+        <joint name="joint_1" type="revolute">
+            <parent link="link_1" />
+            <child link="link_2" />
+            <limit lower="-1" upper="1" effort="1" velocity="1" />
+        </joint>
+        <joint name="joint_2" type="prismatic">
+            <parent link="link_2" />
+            <child link="link_3" />
+            <limit lower="0" upper="1" effort="1" velocity="1" />
+        </joint>
+    </robot>
+    """
+    with io.StringIO(urdf_str) as f:
+        urdf_model = urdf.URDF.load(f)
+
+    urdf_model.update_cfg(
+        {"joint_0": [0.1, 0.2], "joint_1": np.float64(0.3), "joint_2": np.array([0.4])}
+    )
+    assert np.allclose(urdf_model.cfg, [0.1, 0.2, 0.3, 0.4])
+
+    urdf_model.update_cfg({"joint_2": 1})
+    assert np.allclose(urdf_model.cfg, [0.1, 0.2, 0.3, 1.0])
+
+
+def test_split_along_joints():
+    urdf_fname = os.path.join(DIR_MODELS, "franka", "franka.urdf")
+    urdf_model = urdf.URDF.load(urdf_fname, load_meshes=False)
+
+    # nested splits: panda_joint8 and panda_hand_joint are both fixed
+    result = urdf_model.split_along_joints("fixed", load_meshes=False)
+
+    root_urdf = result[0][1]
+    assert len(result) == 4
+    assert "panda_link8" not in root_urdf.link_map
+    assert "panda_joint8" not in root_urdf.joint_map
+    assert "panda_link7" in root_urdf.link_map
+
+    # the parts don't overlap and together contain all links
+    link_names = [l for _, sub_urdf in result for l in sub_urdf.link_map]
+    assert sorted(link_names) == sorted(urdf_model.link_map)
+    assert [sub_urdf.base_link for _, sub_urdf in result[1:]] == [
+        "panda_link8",
+        "panda_hand",
+        "tool_link",
+    ]
+    assert list(result[1][1].link_map) == ["panda_link8"]
+    for matrix, sub_urdf in result[1:]:
+        assert np.allclose(
+            matrix, urdf_model.get_transform(sub_urdf.base_link, urdf_model.base_link)
+        )
+
+
+def test_compose_xyz_rpy():
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        xyz = rng.normal(size=3)
+        rpy = rng.uniform(-np.pi, np.pi, size=3)
+        assert np.allclose(
+            urdf._compose_xyz_rpy(xyz, rpy),
+            tra.compose_matrix(translate=xyz, angles=rpy),
+        )
+
+
+def test_compute_link_transforms():
+    urdf_fname = os.path.join(DIR_MODELS, "franka", "franka.urdf")
+    urdf_model = urdf.URDF.load(urdf_fname, load_meshes=False)
+
+    rng = np.random.default_rng(0)
+    configurations = rng.uniform(-1, 1, size=(5, urdf_model.num_dofs))
+    cfg = urdf_model.cfg.copy()
+
+    link_transforms = urdf_model.compute_link_transforms(configurations)
+
+    assert link_transforms.shape == (5, len(urdf_model.robot.links), 4, 4)
+    assert np.array_equal(urdf_model.cfg, cfg)
+    for configuration, transforms in zip(configurations, link_transforms):
+        urdf_model.update_cfg(configuration)
+        for link, transform in zip(urdf_model.robot.links, transforms):
+            assert np.allclose(transform, urdf_model.get_transform(link.name))
+
+    assert np.allclose(
+        urdf_model.compute_link_transforms(configurations[-1]), link_transforms[-1]
+    )
+    with pytest.raises(ValueError):
+        urdf_model.compute_link_transforms(np.zeros((5, urdf_model.num_dofs + 1)))
+
+
+def test_fk_jax():
+    pytest.importorskip("jax")
+
+    urdf_fname = os.path.join(DIR_MODELS, "franka", "franka.urdf")
+    urdf_model = urdf.URDF.load(urdf_fname, load_meshes=False)
+
+    rng = np.random.default_rng(0)
+    configurations = rng.uniform(-1, 1, size=(5, urdf_model.num_dofs))
+
+    assert np.allclose(
+        np.asarray(urdf_model.fk_jax(configurations)),
+        urdf_model.compute_link_transforms(configurations),
+        atol=1e-5,
+    )
+
+
+def test_validate_filenames(tmp_path):
+    (tmp_path / "meshes").mkdir()
+    trimesh.creation.box(extents=[1, 1, 1]).export(str(tmp_path / "meshes" / "box.stl"))
+    urdf_str = """
+    <robot name="validate_filenames_test">
+        <link name="link_0">
+            <visual>
+                <geometry>
+                    <mesh filename="package://test/meshes/box.stl" />
+                </geometry>
+            </visual>
+            <collision>
+                <geometry>
+                    <mesh filename="package://test/meshes/{}" />
+                </geometry>
+            </collision>
+        </link>
+    </robot>
+    """
+    for collision_fname, valid in [("box.stl", True), ("missing.stl", False)]:
+        urdf_fname = tmp_path / "validate_filenames.urdf"
+        urdf_fname.write_text(urdf_str.format(collision_fname))
+
+        urdf_model = urdf.URDF.load(
+            str(urdf_fname), build_scene_graph=False, load_meshes=False
+        )
+
+        assert urdf_model.validate_filenames() == valid
+
+
+@pytest.mark.parametrize("from_file_object", [True, False])
+def test_validate_filenames_deleted_mesh(tmp_path, from_file_object):
+    mesh_fname = tmp_path / "box.stl"
+    trimesh.creation.box(extents=[1, 1, 1]).export(str(mesh_fname))
+    urdf_str = """
+    <robot name="validate_filenames_test">
+        <link name="link_0">
+            <visual>
+                <geometry>
+                    <mesh filename="{}" />
+                </geometry>
+            </visual>
+        </link>
+    </robot>
+    """.format(mesh_fname)
+
+    if from_file_object:
+        with io.StringIO(urdf_str) as f:
+            urdf_model = urdf.URDF.load(f, build_scene_graph=False, load_meshes=False)
+    else:
+        urdf_fname = tmp_path / "validate_filenames.urdf"
+        urdf_fname.write_text(urdf_str)
+        urdf_model = urdf.URDF.load(
+            str(urdf_fname), build_scene_graph=False, load_meshes=False
+        )
+
+    assert urdf_model.validate_filenames()
+    mesh_fname.unlink()
+    assert not urdf_model.validate_filenames()
+
+
+def test_validate_filenames_unlisted_directory(tmp_path, monkeypatch):
+    trimesh.creation.box(extents=[1, 1, 1]).export(str(tmp_path / "box.stl"))
+    urdf_fname = tmp_path / "validate_filenames.urdf"
+    urdf_fname.write_text(
+        """
+    <robot name="validate_filenames_test">
+        <link name="link_0">
+            <visual>
+                <geometry>
+                    <mesh filename="box.stl" />
+                </geometry>
+            </visual>
+        </link>
+    </robot>
+    """
+    )
+    urdf_model = urdf.URDF.load(
+        str(urdf_fname), build_scene_graph=False, load_meshes=False
+    )
+
+    # e.g. an execute-only directory
+    def scandir(path):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(urdf.os, "scandir", scandir)
+    assert urdf_model.validate_filenames()
+
+
+def test_write_xml_file(tmp_path):
+    urdf_model = urdf.URDF.load(
+        os.path.join(DIR_MODELS, "franka", "franka.urdf"),
+        build_scene_graph=False,
+        load_meshes=False,
+    )
+
+    urdf_fname = tmp_path / "franka.urdf"
+    urdf_model.write_xml_file(str(urdf_fname))
+
+    assert etree.tostring(etree.parse(str(urdf_fname))) == etree.tostring(
+        etree.fromstring(etree.tostring(urdf_model.write_xml(), pretty_print=True))
+    )
+    assert (
+        urdf.URDF._parse_robot_stream(str(urdf_fname))
+        == urdf.URDF._parse_robot(urdf_model.write_xml().getroot())
+    )
+
+
+def test_write_xml_file_none_material(tmp_path):
+    robot = _create_robot()
+    robot.links.append(urdf.Link(name="link_0"))
+    robot.materials.append(urdf.Material(name="red_material"))
+    urdf_model = urdf.URDF(robot=robot, build_scene_graph=False, load_meshes=False)
+    urdf_model.robot.materials.insert(0, None)
+
+    urdf_fname = tmp_path / "none_material.urdf"
+    urdf_model.write_xml_file(str(urdf_fname))
+
+    assert etree.tostring(etree.parse(str(urdf_fname))) == etree.tostring(
+        etree.fromstring(etree.tostring(urdf_model.write_xml(), pretty_print=True))
+    )
+
+
+def test_positional_filename_handler(tmp_path):
+    trimesh.creation.box(extents=[1, 1, 1]).export(str(tmp_path / "box.stl"))
+    urdf_fname = tmp_path / "positional_filename_handler.urdf"
+    urdf_fname.write_text(
+        """
+    <robot name="positional_filename_handler_test">
+        <link name="link_0">
+            <visual>
+                <geometry>
+                    <mesh filename="{}" />
+                </geometry>
+            </visual>
+        </link>
+    </robot>
+    """.format(tmp_path / "box.stl")
+    )
+
+    urdf_model = urdf.URDF.load(str(urdf_fname), filename_handler=lambda f: f)
+
+    assert urdf_model.validate_filenames()
+    assert str(tmp_path / "box.stl") in urdf_model.write_xml_string().decode()
+    urdf_model.write_xml_file(str(tmp_path / "written.urdf"))
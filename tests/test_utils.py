@@ -1,3 +1,4 @@
+import os
 import pytest
 from functools import partial
 
@@ -108,3 +109,51 @@ def test_filename_handler_relative_to_urdf_file_recursive():
         fname="b/c/d.urdf", urdf_fname="/a/b.urdf", level=1
     )
     assert result == "/b/c/d.urdf"
+
+
+def test_filename_handler_magic_file_snapshot(tmp_path):
+    (tmp_path / "meshes").mkdir()
+    (tmp_path / "meshes" / "a.stl").write_text("")
+    (tmp_path / "meshes" / "b.stl").symlink_to(tmp_path / "meshes" / "missing.stl")
+    file_snapshot = urdf._FileSnapshot(str(tmp_path))
+
+    result = urdf.filename_handler_magic(
+        fname="package://robot/meshes/a.stl",
+        dir=str(tmp_path),
+        file_snapshot=file_snapshot,
+    )
+    assert result == os.path.join(str(tmp_path), "meshes", "a.stl")
+    assert file_snapshot._files == {os.path.join(str(tmp_path), "meshes"): {"a.stl"}}
+
+    result = urdf.filename_handler_magic(
+        fname="package://robot/meshes/b.stl",
+        dir=str(tmp_path),
+        file_snapshot=file_snapshot,
+    )
+    assert result == "package://robot/meshes/b.stl"
+
+
+def test_file_snapshot_fallback(tmp_path, monkeypatch):
+    (tmp_path / "meshes").mkdir()
+    (tmp_path / "meshes" / "a.stl").write_text("")
+    (tmp_path / "other").mkdir()
+    (tmp_path / "other" / "b.stl").write_text("")
+
+    # files outside of the root directory are not listed
+    file_snapshot = urdf._FileSnapshot(str(tmp_path / "meshes"))
+    assert file_snapshot.isfile(str(tmp_path / "other" / "b.stl"))
+    assert list(file_snapshot._files) == []
+
+    # each snapshot checks the file system anew
+    (tmp_path / "other" / "b.stl").unlink()
+    assert file_snapshot.isfile(str(tmp_path / "other" / "b.stl"))
+    file_snapshot = urdf._FileSnapshot(str(tmp_path / "meshes"))
+    assert not file_snapshot.isfile(str(tmp_path / "other" / "b.stl"))
+
+    # directories that can't be listed are checked file by file
+    def scandir(path):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(urdf.os, "scandir", scandir)
+    assert file_snapshot.isfile(str(tmp_path / "meshes" / "a.stl"))
+    assert not file_snapshot.isfile(str(tmp_path / "meshes" / "c.stl"))